@@ -12,7 +12,7 @@ CLI remains the primary user interface; programmatic usage is a nice-to-have.
 
 from .common.logging_config import configure_logging  # noqa: F401
 from .core.mods import ModDatabase, format_mod_list_for_server  # noqa: F401
-from .core.rcon import execute_rcon_command, RconClient  # noqa: F401
+from .core.rcon import execute_rcon_command, RconClient, AsyncRconClient  # noqa: F401
 from .common.config import AsaSettings, StartParamsHelper, IniConfigHelper, parse_start_params  # noqa: F401
 
 __all__ = [
@@ -21,6 +21,7 @@ __all__ = [
 	"format_mod_list_for_server",
 	"execute_rcon_command",
 	"RconClient",
+	"AsyncRconClient",
 	"AsaSettings",
 	"StartParamsHelper",
 	"IniConfigHelper",
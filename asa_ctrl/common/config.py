@@ -52,6 +52,22 @@ class IniConfigHelper:
         config.read(file_path)
         return config
     
+    @staticmethod
+    def ini_mtime(file_path: str) -> Optional[int]:
+        """
+        Return the modification time of an INI file in nanoseconds.
+        
+        Args:
+            file_path: Path to the INI file
+            
+        Returns:
+            ``st_mtime_ns`` of the file or None if it cannot be stat'ed
+        """
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+    
     @staticmethod
     def get_game_user_settings() -> Optional[configparser.ConfigParser]:
         """Get the GameUserSettings.ini configuration."""
@@ -4,13 +4,21 @@ RCON (Remote Console) communication module for ASA Control.
 Handles communication with the ARK server via RCON protocol.
 """
 
+import asyncio
+import functools
+import ipaddress
+import itertools
+import queue
+import random
+import re
 import socket
 import struct
+import threading
 import time
-from typing import NamedTuple, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 from asa_ctrl.common.constants import RconPacketTypes
-from asa_ctrl.common.config import AsaSettings
+from asa_ctrl.common.config import AsaSettings, IniConfigHelper
 from asa_ctrl.common.errors import (
     AsaCtrlError,
     RconPasswordNotFoundError,
@@ -22,6 +30,90 @@ from asa_ctrl.common.errors import (
 )
 
 
+# Packet header: size, id, type. IDs/types are signed (-1 marks auth failure).
+_HDR_STRUCT = struct.Struct('<Iii')
+_U32_STRUCT = struct.Struct('<I')
+# Body terminator plus the protocol's trailing pad byte.
+_PACKET_TAIL = b'\x00\x00'
+_HOSTNAME_RE = re.compile(r'[A-Za-z0-9_.-]+')
+# Deletes null bytes and control characters except tab, newline and carriage return.
+_SANITIZE_TABLE = dict.fromkeys(i for i in range(32) if i not in (9, 10, 13))
+# Errors retried without backoff; a fresh connection clears the desync.
+_IMMEDIATE_RETRY = (RconPacketError,)
+
+
+@functools.lru_cache(maxsize=16)
+def _validate_host(ip: str) -> str:
+    """Accept literal IPv4/IPv6 addresses, then fall back to a hostname check."""
+    try:
+        ipaddress.ip_address(ip)
+        return ip
+    except ValueError:
+        if _HOSTNAME_RE.fullmatch(ip):
+            return ip
+    raise ValueError(f"Invalid IP address format: {ip}")
+
+
+# Resolved (family, type, proto, sockaddr) lists keyed by (host, port). Failed
+# lookups are remembered briefly so retry loops do not hammer a broken resolver.
+ADDR_CACHE_TTL = 60.0
+ADDR_NEGATIVE_CACHE_TTL = 5.0
+_ADDR_CACHE: Dict[Tuple[str, int], Tuple[float, Union[list, socket.gaierror]]] = {}
+
+
+def _resolve_address(host: str, port: int) -> list:
+    """Return cached ``getaddrinfo`` results for ``(host, port)`` (IPv4 and IPv6)."""
+    key = (host, port)
+    now = time.monotonic()
+    cached = _ADDR_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        if isinstance(cached[1], socket.gaierror):
+            raise socket.gaierror(*cached[1].args)
+        return cached[1]
+    try:
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as exc:
+        _ADDR_CACHE[key] = (now + ADDR_NEGATIVE_CACHE_TTL, exc)
+        raise
+    addresses = [(family, socktype, proto, sockaddr) for family, socktype, proto, _, sockaddr in infos]
+    _ADDR_CACHE[key] = (now + ADDR_CACHE_TTL, addresses)
+    return addresses
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_setting(key: str, start_params: Optional[str], ini_path: str,
+                    ini_mtime_ns: Optional[int]) -> Tuple[Optional[str], str]:
+    """
+    Resolve a setting from start parameters, falling back to GameUserSettings.ini.
+
+    Cached on the start parameter string and the INI mtime so repeated client
+    construction skips the parse while edits to either source still apply.
+
+    Returns:
+        Tuple of (value or None, source description)
+    """
+    value = AsaSettings._get_start_param_value(start_params, key)
+    if value:
+        return value, "start parameters"
+
+    config = IniConfigHelper.parse_ini(ini_path) if ini_mtime_ns is not None else None
+    if config and 'ServerSettings' in config:
+        value = config['ServerSettings'].get(key)
+    return value, "configuration"
+
+
+def clear_rcon_cache() -> None:
+    """
+    Forget cached RCON port/password lookups and resolved addresses.
+
+    Lookups already follow start parameter and INI edits; call this after
+    changing settings in a way those keys cannot see (e.g. replacing the INI
+    within the filesystem's mtime resolution).
+    """
+    _cached_setting.cache_clear()
+    _ADDR_CACHE.clear()
+
+
 class RconPacket(NamedTuple):
     """RCON packet structure."""
     size: int
@@ -33,6 +125,8 @@ class RconPacket(NamedTuple):
 class RconPacketCodec:
     """Encode/decode RCON packets and validate raw data."""
 
+    __slots__ = ('_max_packet_size', '_min_packet_size')
+
     def __init__(self, max_packet_size: int, min_packet_size: int) -> None:
         self._max_packet_size = max_packet_size
         self._min_packet_size = min_packet_size
@@ -58,35 +152,43 @@ class RconPacketCodec:
         if len(data) > self._max_packet_size:
             raise RconPacketError(f"Packet too large: {len(data)} > {self._max_packet_size}")
 
-    def encode(self, packet_id: int, packet_type: int, body: str) -> bytes:
-        body_bytes = body.encode('utf-8')
-        packet_size = 10 + len(body_bytes)
-        packet_data = struct.pack('<Iii', packet_size, packet_id, packet_type)
-        return packet_data + body_bytes + b'\x00\x00'
+    def encode(self, packet_id: int, packet_type: int, body: Union[str, bytes]) -> bytearray:
+        body_bytes = body.encode('utf-8') if isinstance(body, str) else body
+        # Single allocation: header + body + two terminating nulls (already zeroed).
+        packet = bytearray(14 + len(body_bytes))
+        self.encode_into(packet, 0, packet_id, packet_type, body_bytes)
+        return packet
+
+    @staticmethod
+    def encode_into(buffer: bytearray, offset: int, packet_id: int, packet_type: int, body: bytes) -> int:
+        """
+        Pack a packet into zero-initialised ``buffer`` at ``offset``.
+
+        Returns:
+            Offset just past the packet
+        """
+        body_len = len(body)
+        _HDR_STRUCT.pack_into(buffer, offset, 10 + body_len, packet_id, packet_type)
+        buffer[offset + 12:offset + 12 + body_len] = body
+        return offset + 14 + body_len
 
     def decode(self, data: bytes) -> RconPacket:
         self.validate_packet_data(data)
         if len(data) < 12:
             raise RconPacketError(f"Response too short: {len(data)} bytes")
 
-        size, response_id, response_type = struct.unpack('<Iii', data[:12])
+        size, response_id, response_type = _HDR_STRUCT.unpack_from(data)
         if size < 10:
             raise RconPacketError(f"Invalid response size: {size}")
         if size != len(data) - 4:  # Size field doesn't include itself
             raise RconPacketError(f"Size mismatch: declared {size}, actual {len(data) - 4}")
 
-        body_data = data[12:]
-        if body_data and body_data[-1:] == b'\x00':
-            body_data = body_data[:-1]
-
-        null_pos = body_data.find(b'\x00')
-        if null_pos >= 0:
-            body_data = body_data[:null_pos]
-
-        try:
-            body = body_data.decode('utf-8', errors='replace')
-        except UnicodeDecodeError:
-            body = body_data.decode('utf-8', errors='ignore')
+        # Body is null-terminated (plus a trailing pad byte); decode up to the first
+        # null straight from a memoryview so the body is not copied before decoding.
+        end = data.find(b'\x00', 12)
+        if end < 0:
+            end = len(data)
+        body = str(memoryview(data)[12:end], 'utf-8', 'replace')
 
         return RconPacket(size, response_id, response_type, body)
 
@@ -100,11 +202,16 @@ class RconClient:
     MAX_COMMAND_LENGTH = 1000  # Maximum command length
     DEFAULT_RETRY_COUNT = 3
     DEFAULT_RETRY_DELAY = 1.0
+    MAX_RETRY_DELAY = 2.0
+    # Read-only queries whose responses may be served from the response cache.
+    # getchat/getgamelog drain server-side buffers, so they are never cached.
+    IDEMPOTENT_COMMANDS = frozenset({'listplayers', 'showplayercount'})
+    MAX_CACHED_RESPONSES = 32
     
     def __init__(self, server_ip: str = '127.0.0.1', port: Optional[int] = None, password: Optional[str] = None,
                  connect_timeout: float = 30.0, read_timeout: float = 10.0,
                  retry_count: int = DEFAULT_RETRY_COUNT, retry_delay: float = DEFAULT_RETRY_DELAY,
-                 settings: Optional[AsaSettings] = None):
+                 settings: Optional[AsaSettings] = None, cache_ttl: float = 0.0):
         """
         Initialize RCON client.
         
@@ -115,7 +222,8 @@ class RconClient:
             connect_timeout: Timeout for connection establishment
             read_timeout: Timeout for socket read operations
             retry_count: Number of retry attempts for failed operations
-            retry_delay: Base delay between retry attempts (exponential backoff)
+            retry_delay: Base delay between retry attempts (jittered backoff, capped at MAX_RETRY_DELAY)
+            cache_ttl: Seconds to reuse responses of IDEMPOTENT_COMMANDS (0 disables caching)
         """
         self.server_ip = self._validate_ip(server_ip)
         self._settings = settings or AsaSettings()
@@ -125,8 +233,15 @@ class RconClient:
         self.read_timeout = max(1.0, read_timeout) 
         self.retry_count = max(0, retry_count)
         self.retry_delay = max(0.1, retry_delay)
+        self.cache_ttl = max(0.0, cache_ttl)
+        self._response_cache: Dict[str, Tuple[float, str]] = {}
         self.socket = None
         self._codec = RconPacketCodec(self.MAX_PACKET_SIZE, self.MIN_PACKET_SIZE)
+        self._next_id = itertools.count(1)
+        self._rx_buf = bytearray(self.MAX_PACKET_SIZE)
+        self._reset_rx()
+        self._cached_auth_packet: Optional[Tuple[str, bytes]] = None
+        self._last_used = time.monotonic()
         self._connected = False
         self._authenticated = False
 
@@ -134,6 +249,26 @@ class RconClient:
         if not hasattr(self, "_codec") or self._codec is None:
             self._codec = RconPacketCodec(self.MAX_PACKET_SIZE, self.MIN_PACKET_SIZE)
         return self._codec
+
+    def _get_rx_buffer(self) -> bytearray:
+        if getattr(self, "_rx_buf", None) is None:
+            self._rx_buf = bytearray(self.MAX_PACKET_SIZE)
+            self._reset_rx()
+        return self._rx_buf
+
+    def _reset_rx(self) -> None:
+        """Discard any buffered bytes (e.g. left over from a previous connection)."""
+        self._rx_start = 0
+        self._rx_end = 0
+
+    def _get_auth_packet(self, password: str) -> bytes:
+        """Return the encoded AUTH packet, reusing it across reconnects."""
+        cached = getattr(self, "_cached_auth_packet", None)
+        if cached is None or cached[0] != password:
+            packet_id = next(self._next_id) & 0x7FFFFFFF
+            cached = (password, self._get_codec().encode(packet_id, RconPacketTypes.AUTH, password))
+            self._cached_auth_packet = cached
+        return cached[1]
     
     def _validate_ip(self, ip: str) -> str:
         """
@@ -151,12 +286,7 @@ class RconClient:
         if not ip or not isinstance(ip, str):
             raise ValueError("IP address must be a non-empty string")
         
-        # Basic IP validation - allow hostnames too
-        if not (ip.replace('.', '').replace(':', '').replace('-', '').replace('_', '').isalnum() or 
-                ip in ('localhost', '127.0.0.1', '::1')):
-            raise ValueError(f"Invalid IP address format: {ip}")
-        
-        return ip
+        return _validate_host(ip)
     
     def _validate_port(self, port: int) -> int:
         """
@@ -175,7 +305,7 @@ class RconClient:
             raise ValueError(f"Port must be an integer between 1 and 65535, got: {port}")
         return port
     
-    def _validate_command(self, command: str) -> str:
+    def _validate_command(self, command: str) -> Tuple[str, bytes]:
         """
         Validate and sanitize RCON command.
         
@@ -183,7 +313,7 @@ class RconClient:
             command: Command to validate
             
         Returns:
-            Sanitized command
+            Tuple of (sanitized command, UTF-8 encoded command)
             
         Raises:
             ValueError: If command is invalid
@@ -191,18 +321,18 @@ class RconClient:
         if not command or not isinstance(command, str):
             raise ValueError("Command must be a non-empty string")
             
-        # Strip whitespace and check length
-        command = command.strip()
-        if len(command) > self.MAX_COMMAND_LENGTH:
-            raise ValueError(f"Command too long: {len(command)} > {self.MAX_COMMAND_LENGTH}")
-            
-        # Basic sanitization - remove null bytes and control characters
-        command = ''.join(char for char in command if ord(char) >= 32 or char in '\t\n\r')
+        # Strip whitespace and remove null bytes and control characters
+        command = command.strip().translate(_SANITIZE_TABLE)
         
         if not command:
             raise ValueError("Command contains only invalid characters")
             
-        return command
+        # Length limit applies to the encoded packet body
+        encoded = command.encode('utf-8')
+        if len(encoded) > self.MAX_COMMAND_LENGTH:
+            raise ValueError(f"Command too long: {len(encoded)} > {self.MAX_COMMAND_LENGTH}")
+            
+        return command, encoded
     
     def _validate_packet_data(self, data: bytes, expected_min_size: int = MIN_PACKET_SIZE) -> None:
         """
@@ -217,13 +347,14 @@ class RconClient:
         """
         self._get_codec().validate_packet_data(data, expected_min_size)
     
-    def _with_retry(self, operation, *args, **kwargs):
+    def _with_retry(self, operation, *args, reconnect: bool = True, **kwargs):
         """
         Execute operation with retry logic.
         
         Args:
             operation: Function to execute
             *args: Positional arguments for operation
+            reconnect: Re-open and re-authenticate the connection before each retry
             **kwargs: Keyword arguments for operation
             
         Returns:
@@ -236,12 +367,18 @@ class RconClient:
         
         for attempt in range(self.retry_count + 1):
             try:
+                if attempt and reconnect:
+                    self._connect_once(self.connect_timeout)
                 return operation(*args, **kwargs)
             except (socket.timeout, socket.error, RconPacketError, RconConnectionError, RconTimeoutError) as e:
                 last_exception = e
                 if attempt < self.retry_count:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    time.sleep(delay)
+                    # Packet desyncs are fixed by the reconnect before the next
+                    # attempt, so retry at once; otherwise use jittered backoff
+                    # capped at MAX_RETRY_DELAY.
+                    if not isinstance(e, _IMMEDIATE_RETRY):
+                        time.sleep(min(self.retry_delay * random.uniform(1, 3 ** attempt),
+                                       self.MAX_RETRY_DELAY))
                     # Reset connection state for retry
                     self._connected = False
                     self._authenticated = False
@@ -267,14 +404,7 @@ class RconClient:
         Raises:
             RconPasswordNotFoundError: If password cannot be found
         """
-        # Try to get password from start parameters
-        password = self._settings.get_start_param_value('ServerAdminPassword')
-        
-        if password:
-            return password
-        
-        # Try to get password from GameUserSettings.ini
-        password = self._settings.get_server_setting('ServerAdminPassword')
+        password, _source = self._lookup_setting('ServerAdminPassword')
         
         if password:
             return password
@@ -291,20 +421,17 @@ class RconClient:
         Raises:
             RconPortNotFoundError: If port cannot be found
         """
-        # Try to get port from start parameters
-        port_str = self._settings.get_start_param_value('RCONPort')
+        port_str, source = self._lookup_setting('RCONPort')
         
         if port_str:
-            return self._parse_port_value(port_str, "start parameters")
-        
-        # Try to get port from GameUserSettings.ini
-        port_str = self._settings.get_server_setting('RCONPort')
-        
-        if port_str:
-            return self._parse_port_value(port_str, "configuration")
+            return self._parse_port_value(port_str, source)
             
         raise RconPortNotFoundError("Could not find RCON port in start parameters or configuration")
 
+    def _lookup_setting(self, key: str) -> Tuple[Optional[str], str]:
+        ini_path = self._settings.game_user_settings_path()
+        return _cached_setting(key, self._settings.start_params(), ini_path, IniConfigHelper.ini_mtime(ini_path))
+
     def _parse_port_value(self, port_str: str, source: str) -> int:
         try:
             port = int(port_str)
@@ -331,19 +458,27 @@ class RconClient:
         if not self.socket or not self._connected:
             raise RconConnectionError("Socket not connected")
         
-        # Validate and encode data
-        data = self._validate_command(data) if packet_type == RconPacketTypes.EXEC_COMMAND else data
-        packet_id = int(time.time()) % 2**31  # Use timestamp as packet ID for uniqueness
-        
-        # Pack the packet: size, id, type, body (null-terminated), extra null byte.
-        # IDs and types must be encoded as signed integers because the RCON
-        # protocol uses -1 as the authentication failure sentinel.
-        packet_data = self._get_codec().encode(packet_id, packet_type, data)
+        if packet_type == RconPacketTypes.AUTH:
+            segments = [self._get_auth_packet(data)]
+        else:
+            # Validate and encode data once
+            body = self._validate_command(data)[1] if packet_type == RconPacketTypes.EXEC_COMMAND else data
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            # Monotonic per-client counter keeps IDs unique across rapid commands
+            # (the -1 auth failure sentinel is never produced).
+            packet_id = next(self._next_id) & 0x7FFFFFFF
+
+            # Packet layout: size, id, type, body (null-terminated), extra null byte.
+            # IDs and types must be encoded as signed integers because the RCON
+            # protocol uses -1 as the authentication failure sentinel.
+            header = _HDR_STRUCT.pack(10 + len(body), packet_id, packet_type)
+            segments = [header, body, _PACKET_TAIL]
         
         try:
             # Send with timeout
             self.socket.settimeout(self.read_timeout)
-            self.socket.sendall(packet_data)
+            self._send_segments(segments)
             
             # Receive response with proper buffer management
             response_data = self._receive_full_packet()
@@ -359,6 +494,76 @@ class RconClient:
             self._connected = False
             raise RconConnectionError(f"Socket error during packet operation: {e}") from e
     
+    def _send_segments(self, segments: List[bytes]) -> None:
+        """
+        Write ``segments`` back to back without joining them first.
+
+        Uses a single vectored ``sendmsg`` where available and falls back to
+        ``sendall`` on a joined buffer otherwise (e.g. Windows) or to finish a
+        partial write.
+        """
+        sendmsg = getattr(self.socket, 'sendmsg', None)
+        if sendmsg is None:
+            self.socket.sendall(b''.join(segments))
+            return
+        sent = sendmsg(segments)
+        if sent < sum(map(len, segments)):
+            self.socket.sendall(b''.join(segments)[sent:])
+
+    def _send_packets(self, commands: List[bytes]) -> List[str]:
+        """
+        Pipeline several command packets and collect their responses.
+
+        All packets are written with a single ``sendall`` before any reply is
+        read; responses are matched back to their command by packet ID.
+
+        Args:
+            commands: Already validated, UTF-8 encoded commands to execute
+
+        Returns:
+            Response bodies in the same order as ``commands``
+
+        Raises:
+            RconPacketError: If a response is malformed
+            RconTimeoutError: If operation times out
+            RconConnectionError: If connection fails
+        """
+        if not self.socket or not self._connected:
+            raise RconConnectionError("Socket not connected")
+
+        codec = self._get_codec()
+        packet_ids = [next(self._next_id) & 0x7FFFFFFF for _ in commands]
+        # Pack every packet straight into one preallocated send buffer
+        payload = bytearray(sum(14 + len(command) for command in commands))
+        offset = 0
+        for packet_id, command in zip(packet_ids, commands):
+            offset = codec.encode_into(payload, offset, packet_id, RconPacketTypes.EXEC_COMMAND, command)
+
+        try:
+            self.socket.settimeout(self.read_timeout)
+            self.socket.sendall(payload)
+
+            bodies: Dict[int, str] = {}
+            while len(bodies) < len(packet_ids):
+                response_data = self._receive_full_packet()
+                self._validate_packet_data(response_data)
+                response = codec.decode(response_data)
+                if response.id not in packet_ids or response.id in bodies:
+                    continue
+                if response.type != RconPacketTypes.RESPONSE_VALUE:
+                    raise RconPacketError(
+                        f"Unexpected response type: {response.type}, expected {RconPacketTypes.RESPONSE_VALUE}"
+                    )
+                bodies[response.id] = response.body
+
+            return [bodies[packet_id] for packet_id in packet_ids]
+
+        except socket.timeout as e:
+            raise RconTimeoutError(f"Packet operation timed out after {self.read_timeout}s") from e
+        except socket.error as e:
+            self._connected = False
+            raise RconConnectionError(f"Socket error during packet operation: {e}") from e
+
     def _receive_full_packet(self) -> bytes:
         """
         Receive a complete RCON packet, handling partial reads.
@@ -370,10 +575,12 @@ class RconClient:
             RconPacketError: If packet is invalid
             RconTimeoutError: If operation times out
         """
-        # First, read the size field (4 bytes)
+        # Packets are read from the reusable receive buffer; a single recv
+        # usually pulls in the size field, the body and any queued packets.
+        buffer = self._get_rx_buffer()
         try:
-            size_data = self._receive_exact(4)
-            packet_size = struct.unpack('<I', size_data)[0]
+            self._fill_rx(4)
+            packet_size = _U32_STRUCT.unpack_from(buffer, self._rx_start)[0]
             
             # Validate size
             if packet_size < 10:
@@ -381,10 +588,15 @@ class RconClient:
             if packet_size > self.MAX_PACKET_SIZE - 4:
                 raise RconPacketError(f"Packet size too large: {packet_size}")
             
-            # Read the rest of the packet
-            remaining_data = self._receive_exact(packet_size)
+            # Make sure the rest of the packet is buffered
+            total = 4 + packet_size
+            self._fill_rx(total)
+            start = self._rx_start
+            self._rx_start += total
+            if self._rx_start == self._rx_end:
+                self._rx_start = self._rx_end = 0
             
-            return size_data + remaining_data
+            return bytes(memoryview(buffer)[start:start + total])
             
         except socket.timeout as e:
             raise RconTimeoutError("Timeout receiving packet") from e
@@ -392,38 +604,33 @@ class RconClient:
             self._connected = False
             raise RconConnectionError(f"Connection error receiving packet: {e}") from e
     
-    def _receive_exact(self, num_bytes: int) -> bytes:
+    def _fill_rx(self, needed: int) -> None:
         """
-        Receive exactly num_bytes from socket.
-        
+        Ensure at least ``needed`` unread bytes are held in the receive buffer.
+
         Args:
-            num_bytes: Number of bytes to receive
-            
-        Returns:
-            Received data
-            
+            needed: Number of unread bytes required (at most MAX_PACKET_SIZE)
+
         Raises:
             RconConnectionError: If connection is lost
-            RconPacketError: If not enough data received
         """
         if self.socket is None:
             raise RconConnectionError("Socket not connected")
-        data = b''
-        try:
-            while len(data) < num_bytes:
-                chunk = self.socket.recv(num_bytes - len(data))
-                if not chunk:
-                    raise RconConnectionError("Connection closed by remote host")
-                data += chunk
-        except socket.timeout as e:
-            # Normalize socket timeout to RconTimeoutError
-            raise RconTimeoutError("Timeout while receiving data") from e
-        except socket.error as e:
-            # Mark as disconnected and raise a connection error
-            self._connected = False
-            raise RconConnectionError(f"Connection error while receiving data: {e}") from e
-        return data
-    
+        buffer = self._get_rx_buffer()
+        if self._rx_end - self._rx_start >= needed:
+            return
+        if self._rx_start + needed > len(buffer):
+            # Move the unread tail to the front to make room for the rest
+            pending = self._rx_end - self._rx_start
+            buffer[:pending] = buffer[self._rx_start:self._rx_end]
+            self._rx_start, self._rx_end = 0, pending
+        view = memoryview(buffer)
+        while self._rx_end - self._rx_start < needed:
+            received = self.socket.recv_into(view[self._rx_end:])
+            if not received:
+                raise RconConnectionError("Connection closed by remote host")
+            self._rx_end += received
+
     def _authenticate(self) -> bool:
         """
         Authenticate with the RCON server.
@@ -448,6 +655,90 @@ class RconClient:
         self._authenticated = True
         return True
     
+    def _configure_socket(self) -> None:
+        """
+        Tune the RCON socket for small request/response exchanges.
+
+        Disables Nagle so tiny command packets are not held back waiting for
+        ACKs, and enables keepalive so pooled idle connections are probed.
+        Options are best effort; unsupported ones are skipped.
+        """
+        sock = self.socket
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            buffer_size = self.MAX_PACKET_SIZE * 4
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                if sock.getsockopt(socket.SOL_SOCKET, option) < buffer_size:
+                    sock.setsockopt(socket.SOL_SOCKET, option, buffer_size)
+        except OSError:
+            pass
+    
+    def _open_socket(self, timeout: float) -> None:
+        """
+        Connect a new socket to the first reachable resolved address.
+
+        Args:
+            timeout: Timeout in seconds for each connection attempt
+
+        Raises:
+            socket.error: If the host cannot be resolved or no address accepts the connection
+        """
+        last_error: Optional[OSError] = None
+        for family, socktype, proto, sockaddr in _resolve_address(self.server_ip, self.port):
+            self.socket = socket.socket(family, socktype, proto)
+            self._reset_rx()
+            self._configure_socket()
+            self.socket.settimeout(timeout)
+            try:
+                self.socket.connect(sockaddr)
+                return
+            except OSError as exc:
+                last_error = exc
+                self.socket.close()
+                self.socket = None
+        raise last_error or socket.error(f"No addresses found for {self.server_ip}")
+
+    def _connect_once(self, connect_timeout: float) -> None:
+        """
+        Open a new socket and authenticate, without retrying.
+
+        Args:
+            connect_timeout: Timeout in seconds for establishing the connection
+
+        Raises:
+            RconConnectionError: If connection fails
+            RconAuthenticationError: If authentication fails
+            RconTimeoutError: If connection times out
+        """
+        try:
+            self._open_socket(connect_timeout)
+            self._connected = True
+
+            if not self._authenticate():
+                raise RconAuthenticationError("RCON authentication failed")
+
+        except socket.timeout as exc:
+            self.close()
+            raise RconTimeoutError(
+                f"Timed out connecting to RCON server at {self.server_ip}:{self.port} "
+                f"after {connect_timeout}s"
+            ) from exc
+        except socket.gaierror as exc:
+            self.close()
+            raise RconConnectionError(
+                f"Failed to resolve hostname {self.server_ip}: {exc}"
+            ) from exc
+        except socket.error as exc:
+            self.close()
+            raise RconConnectionError(
+                f"Failed to connect to RCON server at {self.server_ip}:{self.port}: {exc}"
+            ) from exc
+
     def connect(self, timeout: Optional[float] = None) -> None:
         """
         Connect to the RCON server and authenticate.
@@ -464,37 +755,8 @@ class RconClient:
             return  # Already connected and authenticated
         
         connect_timeout = timeout if timeout is not None else self.connect_timeout
-        
-        def _connect_once():
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(connect_timeout)
-            
-            try:
-                self.socket.connect((self.server_ip, self.port))
-                self._connected = True
-                
-                if not self._authenticate():
-                    raise RconAuthenticationError("RCON authentication failed")
-                    
-            except socket.timeout as exc:
-                self.close()
-                raise RconTimeoutError(
-                    f"Timed out connecting to RCON server at {self.server_ip}:{self.port} "
-                    f"after {connect_timeout}s"
-                ) from exc
-            except socket.gaierror as exc:
-                self.close()
-                raise RconConnectionError(
-                    f"Failed to resolve hostname {self.server_ip}: {exc}"
-                ) from exc
-            except socket.error as exc:
-                self.close()
-                raise RconConnectionError(
-                    f"Failed to connect to RCON server at {self.server_ip}:{self.port}: {exc}"
-                ) from exc
-        
         # Use retry logic for connection
-        self._with_retry(_connect_once)
+        self._with_retry(self._connect_once, connect_timeout, reconnect=False)
     
     def execute_command(self, command: str) -> str:
         """
@@ -514,6 +776,14 @@ class RconClient:
         """
         if not command or not isinstance(command, str):
             raise ValueError("Command must be a non-empty string")
+
+        cache_key = command.strip().lower()
+        cacheable = (getattr(self, "cache_ttl", 0.0) > 0
+                     and cache_key.partition(' ')[0] in self.IDEMPOTENT_COMMANDS)
+        if cacheable:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
         
         # Ensure we're connected and authenticated
         if not self._connected or not self._authenticated:
@@ -533,12 +803,45 @@ class RconClient:
             raise RconPacketError("Empty response from RCON command")
         if not isinstance(result, str):
             result = str(result)
+        if cacheable:
+            cache = self._response_cache
+            cache.pop(cache_key, None)
+            if len(cache) >= self.MAX_CACHED_RESPONSES:
+                del cache[next(iter(cache))]  # Evict the oldest entry
+            cache[cache_key] = (time.monotonic(), result)
         return result
     
+    def execute_commands(self, commands: List[str]) -> List[str]:
+        """
+        Execute several RCON commands over one pipelined round-trip.
+
+        Args:
+            commands: The commands to execute
+
+        Returns:
+            The command responses, in the same order as ``commands``
+
+        Raises:
+            RconConnectionError: If not connected or connection fails
+            RconPacketError: If packet is malformed
+            RconTimeoutError: If commands time out
+            ValueError: If any command is invalid
+        """
+        validated = [self._validate_command(command)[1] for command in commands]
+        if not validated:
+            return []
+
+        # Ensure we're connected and authenticated
+        if not self._connected or not self._authenticated:
+            self.connect()
+
+        return self._with_retry(self._send_packets, validated)
+
     def close(self) -> None:
         """Close the RCON connection and clean up resources."""
         self._connected = False
         self._authenticated = False
+        self._reset_rx()
         if self.socket:
             try:
                 self.socket.close()
@@ -556,6 +859,19 @@ class RconClient:
         """
         return self._connected and self._authenticated and self.socket is not None
     
+    @staticmethod
+    def shutdown_pool() -> None:
+        """Close every idle client pooled by execute_rcon_command."""
+        with _POOL_LOCK:
+            pools = list(_POOL.values())
+            _POOL.clear()
+        for idle in pools:
+            while True:
+                try:
+                    idle.get_nowait().close()
+                except queue.Empty:
+                    break
+    
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -566,16 +882,282 @@ class RconClient:
         self.close()
 
 
-def execute_rcon_command(command: str, server_ip: str = '127.0.0.1') -> str:
+class AsyncRconClient:
+    """
+    asyncio RCON client.
+
+    Many sessions can share one event loop thread instead of one OS thread per
+    in-flight command. Run several clients concurrently with ``asyncio.gather``.
+    """
+
+    def __init__(self, server_ip: str = '127.0.0.1', port: Optional[int] = None, password: Optional[str] = None,
+                 connect_timeout: float = 30.0, read_timeout: float = 10.0,
+                 settings: Optional[AsaSettings] = None):
+        """
+        Initialize async RCON client.
+
+        Args:
+            server_ip: Server IP address
+            port: RCON port (auto-detected if None)
+            password: RCON password (auto-detected if None)
+            connect_timeout: Timeout for connection establishment
+            read_timeout: Timeout for each response read
+        """
+        # Validation and port/password discovery are shared with the blocking client
+        self._client = RconClient(server_ip, port, password, connect_timeout, read_timeout, settings=settings)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def server_ip(self) -> str:
+        return self._client.server_ip
+
+    @property
+    def port(self) -> int:
+        return self._client.port
+
+    def is_connected(self) -> bool:
+        """Return True once connected and authenticated."""
+        return self._writer is not None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Created lazily so the lock binds to the loop that first uses it (Python 3.9).
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def connect(self) -> None:
+        """
+        Connect to the RCON server and authenticate.
+
+        Raises:
+            RconConnectionError: If connection fails
+            RconAuthenticationError: If authentication fails
+            RconTimeoutError: If connection times out
+        """
+        async with self._get_lock():
+            await self._connect()
+
+    async def _connect(self) -> None:
+        """Connect and authenticate; the caller must hold the client lock."""
+        if self._writer is not None:
+            return
+        client = self._client
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(client.server_ip, client.port), client.connect_timeout
+            )
+        except asyncio.TimeoutError as exc:
+            raise RconTimeoutError(
+                f"Timed out connecting to RCON server at {client.server_ip}:{client.port} "
+                f"after {client.connect_timeout}s"
+            ) from exc
+        except OSError as exc:
+            raise RconConnectionError(
+                f"Failed to connect to RCON server at {client.server_ip}:{client.port}: {exc}"
+            ) from exc
+
+        self._reader, self._writer = reader, writer
+        try:
+            writer.write(client._get_auth_packet(client.password))
+            await writer.drain()
+            response = await self._read_packet()
+        except BaseException:
+            await self.close()
+            raise
+        if response.id == -1:
+            await self.close()
+            raise RconAuthenticationError("RCON authentication failed: server returned -1 response ID")
+
+    async def _read_packet(self) -> RconPacket:
+        """
+        Read and decode one packet from the stream.
+
+        Raises:
+            RconPacketError: If packet is invalid
+            RconTimeoutError: If the read times out
+            RconConnectionError: If connection is lost
+        """
+        client = self._client
+        try:
+            header = await asyncio.wait_for(self._reader.readexactly(4), client.read_timeout)
+            packet_size = _U32_STRUCT.unpack_from(header)[0]
+            if packet_size < 10:
+                raise RconPacketError(f"Invalid packet size: {packet_size}")
+            if packet_size > client.MAX_PACKET_SIZE - 4:
+                raise RconPacketError(f"Packet size too large: {packet_size}")
+            rest = await asyncio.wait_for(self._reader.readexactly(packet_size), client.read_timeout)
+        except asyncio.TimeoutError as exc:
+            raise RconTimeoutError(f"Packet operation timed out after {client.read_timeout}s") from exc
+        except asyncio.IncompleteReadError as exc:
+            raise RconConnectionError("Connection closed by remote host") from exc
+        except OSError as exc:
+            raise RconConnectionError(f"Connection error receiving packet: {exc}") from exc
+        return client._get_codec().decode(header + rest)
+
+    async def execute_command(self, command: str) -> str:
+        """
+        Execute an RCON command.
+
+        Args:
+            command: The command to execute
+
+        Returns:
+            The command response
+        """
+        if not command or not isinstance(command, str):
+            raise ValueError("Command must be a non-empty string")
+        return (await self.execute_many([command]))[0]
+
+    async def execute_many(self, commands: List[str]) -> List[str]:
+        """
+        Pipeline several RCON commands over this client's connection.
+
+        Concurrent calls on one client are serialised, since a stream can only
+        have one reader at a time.
+
+        Args:
+            commands: The commands to execute
+
+        Returns:
+            The command responses, in the same order as ``commands``
+
+        Raises:
+            RconConnectionError: If connection fails
+            RconPacketError: If packet is malformed
+            RconTimeoutError: If commands time out
+            ValueError: If any command is invalid
+        """
+        client = self._client
+        validated = [client._validate_command(command)[1] for command in commands]
+        if not validated:
+            return []
+        async with self._get_lock():
+            return await self._execute_locked(validated)
+
+    async def _execute_locked(self, validated: List[str]) -> List[str]:
+        """Send validated commands and collect their responses; the caller holds the lock."""
+        client = self._client
+        await self._connect()
+
+        codec = client._get_codec()
+        packet_ids = [next(client._next_id) & 0x7FFFFFFF for _ in validated]
+        payload = bytearray(sum(14 + len(command) for command in validated))
+        offset = 0
+        for packet_id, command in zip(packet_ids, validated):
+            offset = codec.encode_into(payload, offset, packet_id, RconPacketTypes.EXEC_COMMAND, command)
+        try:
+            self._writer.write(payload)
+            await self._writer.drain()
+
+            bodies: Dict[int, str] = {}
+            while len(bodies) < len(packet_ids):
+                response = await self._read_packet()
+                if response.id not in packet_ids or response.id in bodies:
+                    continue
+                if response.type != RconPacketTypes.RESPONSE_VALUE:
+                    raise RconPacketError(
+                        f"Unexpected response type: {response.type}, expected {RconPacketTypes.RESPONSE_VALUE}"
+                    )
+                bodies[response.id] = response.body
+        except OSError as exc:
+            await self.close()
+            raise RconConnectionError(f"Socket error during packet operation: {exc}") from exc
+        except BaseException:
+            # Any other failure (including cancellation) leaves the stream
+            # mid-exchange, so drop the connection rather than reuse it.
+            await self.close()
+            raise
+
+        return [bodies[packet_id] for packet_id in packet_ids]
+
+    async def close(self) -> None:
+        """Close the RCON connection."""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass  # Ignore errors during cleanup
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+# Idle authenticated clients leased by execute_rcon_command, keyed by (server_ip, port).
+POOL_MAX_IDLE_SECONDS = 60.0
+_POOL: Dict[Tuple[str, int], "queue.SimpleQueue[RconClient]"] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _pool_get(key: Tuple[str, int]) -> Optional[RconClient]:
+    """Lease a live idle client for ``key``, discarding stale entries."""
+    with _POOL_LOCK:
+        idle = _POOL.get(key)
+    if idle is None:
+        return None
+    now = time.monotonic()
+    while True:
+        try:
+            client = idle.get_nowait()
+        except queue.Empty:
+            return None
+        if client.is_connected() and now - client._last_used <= POOL_MAX_IDLE_SECONDS:
+            return client
+        client.close()
+
+
+def _pool_put(key: Tuple[str, int], client: RconClient) -> None:
+    """Return a leased client to the idle pool."""
+    client._last_used = time.monotonic()
+    with _POOL_LOCK:
+        idle = _POOL.setdefault(key, queue.SimpleQueue())
+    idle.put(client)
+
+
+def _execute_leased(client: RconClient, command: str) -> str:
+    """Run a command on a leased client, closing it if anything fails."""
+    try:
+        if not client.is_connected():
+            client.connect()
+        return client.execute_command(command)
+    except Exception:
+        client.close()
+        raise
+
+
+def execute_rcon_command(command: str, server_ip: str = '127.0.0.1',
+                         settings: Optional[AsaSettings] = None) -> str:
     """
     Execute a single RCON command (convenience function).
-    
+
+    Authenticated clients are pooled per ``(server_ip, port)`` so repeated
+    calls skip the TCP handshake and authentication round-trip. A stale
+    connection is dropped and the command retried once on a fresh client.
+
     Args:
         command: The command to execute
         server_ip: Server IP address
-        
+        settings: Settings used to discover the RCON port and password
+
     Returns:
         The command response
     """
-    with RconClient(server_ip) as client:
-        return client.execute_command(command)
+    client = RconClient(server_ip, settings=settings)
+    key = (client.server_ip, client.port)
+    leased = _pool_get(key) or client
+    try:
+        result = _execute_leased(leased, command)
+    except RconConnectionError:
+        if leased is client:
+            raise
+        leased = client
+        result = _execute_leased(leased, command)
+    _pool_put(key, leased)
+    return result
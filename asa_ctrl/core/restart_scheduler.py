@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import signal
-import subprocess
 import time
 import os
 from datetime import datetime, timedelta
@@ -11,12 +12,18 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple
 
 from asa_ctrl.common.config import AsaSettings
+from asa_ctrl.common.errors import AsaCtrlError
 from asa_ctrl.common.logging_config import configure_logging, get_logger
+from asa_ctrl.core.rcon import RconClient, execute_rcon_command
 
 
-MAX_SLEEP_INTERVAL_SECONDS = 30
 POST_RESTART_DELAY_SECONDS = 10
 
+_ALL_MINUTES = bytes(range(60))
+_ALL_HOURS = bytes(range(24))
+# Bitmask for a wildcard field: every bit set, so (mask >> value) & 1 is always 1
+_ANY_MASK = -1
+
 
 _MONTH_NAMES: Dict[str, int] = {
     "jan": 1,
@@ -66,15 +73,11 @@ class CronSchedule:
     )
 
     def __init__(self, expression: str) -> None:
-        parts = [part.strip() for part in expression.split() if part.strip()]
-        if len(parts) != 5:
-            raise ValueError(
-                "Cron expression must have exactly 5 fields (minute hour day month weekday)"
-            )
-
-        self._fields: List[Optional[Tuple[int, ...]]] = []
-        for value, spec in zip(parts, self._FIELD_SPECS):
-            self._fields.append(self._parse_field(value, spec))
+        compiled = _compile_cron(" ".join(expression.split()))
+        self._fields = compiled.fields
+        self._field_masks = compiled.masks
+        self._weekday_mask = compiled.weekday_mask
+        self._day_filtered = compiled.day_filtered
 
     @staticmethod
     def _parse_field(
@@ -145,31 +148,107 @@ class CronSchedule:
     def next_run(self, reference: datetime) -> datetime:
         """Return the next scheduled time strictly after ``reference``."""
 
-        current = reference.replace(second=0, microsecond=0) + timedelta(minutes=1)
-        limit = 366 * 24 * 60  # One year of minutes safety limit
-        for _ in range(limit):
-            if self._matches(current):
-                return current
-            current += timedelta(minutes=1)
+        minute_values, hour_values, _, month_values, _ = self._fields
+        minutes = minute_values or _ALL_MINUTES
+        hours = hour_values or _ALL_HOURS
+        month_mask = self._field_masks[3]
+        # Common shapes like "0 4 * * *" leave both day fields open; skip the check
+        day_filtered = self._day_filtered
+
+        start = reference.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = start + timedelta(days=366)  # One year safety limit
+        day = start.replace(hour=0, minute=0)
+        hour, minute = start.hour, start.minute
+        # Walk whole days (jumping straight to the next allowed month) and
+        # bisect into the sorted hour/minute values of the first matching day.
+        while day < limit:
+            if not (month_mask >> day.month) & 1:
+                index = bisect.bisect_right(month_values, day.month)
+                if index < len(month_values):
+                    day = day.replace(month=month_values[index], day=1)
+                else:
+                    day = day.replace(year=day.year + 1, month=month_values[0], day=1)
+                hour = minute = 0
+                continue
+
+            if not day_filtered or self._day_matches(day):
+                index = bisect.bisect_left(hours, hour)
+                if index < len(hours) and hours[index] == hour:
+                    minute_index = bisect.bisect_left(minutes, minute)
+                    if minute_index < len(minutes):
+                        return self._within_limit(day.replace(hour=hour, minute=minutes[minute_index]), limit)
+                    index += 1
+                if index < len(hours):
+                    return self._within_limit(day.replace(hour=hours[index], minute=minutes[0]), limit)
+
+            day += timedelta(days=1)
+            hour = minute = 0
         raise ValueError("Unable to resolve next cron run within one year")
 
+    @staticmethod
+    def _within_limit(candidate: datetime, limit: datetime) -> datetime:
+        if candidate >= limit:
+            raise ValueError("Unable to resolve next cron run within one year")
+        return candidate
+
     def _matches(self, candidate: datetime) -> bool:
-        minute_values, hour_values, day_values, month_values, weekday_values = self._fields
+        minute_mask, hour_mask, _, month_mask, _ = self._field_masks
 
-        if minute_values is not None and candidate.minute not in minute_values:
+        if not (minute_mask >> candidate.minute) & 1:
             return False
-        if hour_values is not None and candidate.hour not in hour_values:
+        if not (hour_mask >> candidate.hour) & 1:
             return False
-        if month_values is not None and candidate.month not in month_values:
+        if not (month_mask >> candidate.month) & 1:
             return False
+        return not self._day_filtered or self._day_matches(candidate)
+
+    def _day_matches(self, candidate: datetime) -> bool:
+        day_mask = self._field_masks[2]
+        weekday_mask = self._weekday_mask
 
-        day_match = day_values is None or candidate.day in day_values
-        cron_weekday = (candidate.weekday() + 1) % 7
-        weekday_match = weekday_values is None or cron_weekday in weekday_values
+        day_match = (day_mask >> candidate.day) & 1
+        weekday_match = (weekday_mask >> candidate.weekday()) & 1
 
-        if day_values is not None and weekday_values is not None:
-            return (candidate.day in day_values) or (cron_weekday in weekday_values)
-        return day_match and weekday_match
+        if day_mask != _ANY_MASK and weekday_mask != _ANY_MASK:
+            return bool(day_match or weekday_match)
+        return bool(day_match and weekday_match)
+
+
+@dataclass(frozen=True)
+class _CompiledCron:
+    # Sorted bytes (every cron value fits in 0..59) drive bisect in next_run
+    # and are immutable, so every schedule can share them; the bitmasks
+    # answer membership with a shift and AND.
+    fields: Tuple[Optional[bytes], ...]
+    masks: Tuple[int, ...]
+    # Weekday bits re-indexed by Python's weekday() (Monday=0); cron uses Sunday=0
+    weekday_mask: int
+    # False when both day-of-month and weekday are wildcards
+    day_filtered: bool
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_cron(expression: str) -> _CompiledCron:
+    """Parse a whitespace-normalized cron expression once per process."""
+
+    parts = expression.split()
+    if len(parts) != 5:
+        raise ValueError(
+            "Cron expression must have exactly 5 fields (minute hour day month weekday)"
+        )
+
+    fields: List[Optional[bytes]] = []
+    for value, spec in zip(parts, CronSchedule._FIELD_SPECS):
+        values = CronSchedule._parse_field(value, spec)
+        fields.append(None if values is None else bytes(values))
+    masks = tuple(
+        _ANY_MASK if values is None else sum(1 << value for value in values) for values in fields
+    )
+    weekday_mask = masks[4]
+    if weekday_mask != _ANY_MASK:
+        weekday_mask = sum(1 << day for day in range(7) if (masks[4] >> ((day + 1) % 7)) & 1)
+    day_filtered = masks[2] != _ANY_MASK or weekday_mask != _ANY_MASK
+    return _CompiledCron(tuple(fields), masks, weekday_mask, day_filtered)
 
 
 def parse_warning_offsets(raw: str) -> List[int]:
@@ -178,7 +257,7 @@ def parse_warning_offsets(raw: str) -> List[int]:
     if not raw:
         return [30, 5, 1]
 
-    values: List[int] = []
+    values: Set[int] = set()
     for part in raw.split(","):
         part = part.strip()
         if not part:
@@ -189,30 +268,42 @@ def parse_warning_offsets(raw: str) -> List[int]:
             raise ValueError(f"Invalid restart warning offset '{part}'") from exc
         if value <= 0:
             raise ValueError("Restart warnings must be positive minute values")
-        if value not in values:
-            values.append(value)
+        values.add(value)
     if not values:
         raise ValueError("No valid restart warning offsets provided")
-    values.sort(reverse=True)
-    return values
+    return sorted(values, reverse=True)
+
+
+# Last parsed PID per file, keyed by the stat signature it was read with.
+_PID_CACHE: Dict[str, Tuple[Tuple[int, int, int], Optional[int]]] = {}
 
 
 def _read_pid_from_file(path: Optional[str]) -> Optional[int]:
     if not path:
         return None
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            content = handle.read().strip()
-    except FileNotFoundError:
-        return None
+        stat = os.stat(path)
     except OSError:
+        _PID_CACHE.pop(path, None)
         return None
-    if not content:
-        return None
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _PID_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    pid: Optional[int] = None
     try:
-        return int(content)
-    except ValueError:
+        with open(path, "r", encoding="utf-8") as handle:
+            content = handle.read().strip()
+    except OSError:
         return None
+    if content:
+        try:
+            pid = int(content)
+        except ValueError:
+            pid = None
+    _PID_CACHE[path] = (signature, pid)
+    return pid
 
 
 def _is_process_alive(pid: Optional[int]) -> bool:
@@ -225,48 +316,91 @@ def _is_process_alive(pid: Optional[int]) -> bool:
     return True
 
 
-def _run_rcon_command(command: str, logger, settings: AsaSettings) -> bool:
-    exe = settings.asa_ctrl_bin()
-    result = subprocess.run(
-        [exe, "rcon", "--exec", command],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.PIPE,
-        check=False,
-        text=True,
-    )
-    if result.returncode != 0:
-        logger.warning("Failed to execute RCON command '%s': %s", command, result.stderr.strip())
+def _run_rcon_command(command: str, logger, settings: AsaSettings,
+                      client: Optional[RconClient] = None) -> bool:
+    # In-process call: reuses an authenticated RCON connection instead of
+    # starting an ``asa-ctrl rcon --exec`` interpreter per announcement. The
+    # client reconnects and retries on its own, so a stale connection needs
+    # no extra attempt here.
+    try:
+        if client is None:
+            execute_rcon_command(command, settings=settings)
+        else:
+            client.execute_command(command)
+    except (AsaCtrlError, ValueError) as exc:
+        logger.warning("Failed to execute RCON command '%s': %s", command, exc)
         return False
     return True
 
 
-def _announce(minutes: int, target: datetime, logger, settings: AsaSettings) -> None:
-    time_str = target.strftime("%H:%M")
+def _open_window_client(settings: AsaSettings, logger) -> Optional[RconClient]:
+    """Create the RCON client shared by every announcement of one restart window."""
+
+    try:
+        return RconClient(settings=settings)
+    except (AsaCtrlError, ValueError) as exc:
+        logger.debug("RCON client unavailable for restart window: %s", exc)
+        return None
+
+
+def _announce(minutes: int, time_str: str, logger, settings: AsaSettings,
+              client: Optional[RconClient] = None) -> None:
     if minutes == 1:
         message = f"Server restart in 1 minute (scheduled {time_str})."
     else:
         message = f"Server restart in {minutes} minutes (scheduled {time_str})."
-    _run_rcon_command(f"serverchat {message}", logger, settings)
+    _run_rcon_command(f"serverchat {message}", logger, settings, client=client)
 
 
-def _announce_now(target: datetime, logger, settings: AsaSettings) -> None:
-    time_str = target.strftime("%H:%M")
-    _run_rcon_command(f"serverchat Server restarting now (scheduled {time_str}).", logger, settings)
+def _announce_now(time_str: str, logger, settings: AsaSettings,
+                  client: Optional[RconClient] = None) -> None:
+    _run_rcon_command(
+        f"serverchat Server restarting now (scheduled {time_str}).", logger, settings, client=client
+    )
 
 
-def _trigger_restart(supervisor_pid_file: Optional[str], logger) -> None:
+def _trigger_restart(supervisor_pid_file: Optional[str], logger) -> bool:
     pid = _read_pid_from_file(supervisor_pid_file)
     if pid is None:
         logger.error("Cannot trigger restart - supervisor PID file missing (%s)", supervisor_pid_file)
-        return
+        return False
     if not _is_process_alive(pid):
         logger.error("Cannot trigger restart - supervisor PID %s not alive", pid)
-        return
+        return False
     logger.info("Triggering scheduled restart via signal to PID %s", pid)
     try:
         os.kill(pid, signal.SIGUSR1) # type: ignore // SIGUSR1 may not be defined on Windows
     except ProcessLookupError:
         logger.error("Failed to trigger restart - supervisor process %s not found", pid)
+        return False
+    return True
+
+
+def _build_events(
+    next_run: datetime, warnings: List[int], now: datetime
+) -> List[Tuple[str, datetime, Optional[int]]]:
+    """Return the still-pending warning events plus the restart, in time order.
+
+    ``warnings`` must be sorted in descending order (as returned by
+    ``parse_warning_offsets``), which already yields ascending event times.
+    """
+
+    events: List[Tuple[str, datetime, Optional[int]]] = []
+    for offset in warnings:
+        warning_time = next_run - timedelta(minutes=offset)
+        if warning_time >= now:
+            events.append(("warn", warning_time, offset))
+    events.append(("restart", next_run, None))
+    return events
+
+
+def _wait_until(event_time: datetime) -> None:
+    # One sleep per event; the loop only repeats if we woke early
+    # (e.g. the wall clock was stepped back while sleeping).
+    delta = (event_time - datetime.now()).total_seconds()
+    while delta > 0:
+        time.sleep(delta)
+        delta = (event_time - datetime.now()).total_seconds()
 
 
 def run_scheduler(settings: Optional[AsaSettings] = None) -> None:
@@ -303,47 +437,57 @@ def run_scheduler(settings: Optional[AsaSettings] = None) -> None:
         warnings,
     )
 
+    next_run: Optional[datetime] = None
+    time_str = ""
     while True:
         now = datetime.now()
+        # Keep the pending restart pinned until it fires or its time has passed
+        if next_run is None or now >= next_run:
+            try:
+                next_run = schedule.next_run(now)
+            except ValueError as exc:
+                logger.error("Failed to compute next restart time: %s", exc)
+                return
+            logger.info("Next scheduled restart at %s", next_run.strftime("%Y-%m-%d %H:%M"))
+            # Formatted once per window; every announcement reuses it
+            time_str = next_run.strftime("%H:%M")
+
+        events = _build_events(next_run, warnings, now)
+
+        # One RCON session serves every announcement of this window
+        client = _open_window_client(settings, logger)
+        server_pid: Optional[int] = None
+        restarted = False
         try:
-            next_run = schedule.next_run(now)
-        except ValueError as exc:
-            logger.error("Failed to compute next restart time: %s", exc)
-            return
-
-        logger.info("Next scheduled restart at %s", next_run.strftime("%Y-%m-%d %H:%M"))
-
-        events: List[Tuple[str, datetime, Optional[int]]] = []
-        for offset in warnings:
-            warning_time = next_run - timedelta(minutes=offset)
-            if warning_time >= now:
-                events.append(("warn", warning_time, offset))
-        events.sort(key=lambda item: item[1])
-        events.append(("restart", next_run, None))
-
-        for event_type, event_time, payload in events:
-            while True:
-                now = datetime.now()
-                delta = (event_time - now).total_seconds()
-                if delta <= 0:
+            for event_type, event_time, payload in events:
+                _wait_until(event_time)
+
+                if server_pid_file:
+                    # Reuse the PID read earlier in this window; re-read the file only
+                    # when that process is gone (e.g. the server was restarted).
+                    if not _is_process_alive(server_pid):
+                        server_pid = _read_pid_from_file(server_pid_file)
+                    if not _is_process_alive(server_pid):
+                        logger.info("Server process not running - postponing notifications until it comes back")
+                        break
+
+                if event_type == "warn" and payload is not None:
+                    logger.info("Announcing restart %s minutes before scheduled time", payload)
+                    _announce(payload, time_str, logger, settings, client=client)
+                elif event_type == "restart":
+                    logger.info("Scheduled restart window reached - notifying players and signalling supervisor")
+                    _announce_now(time_str, logger, settings, client=client)
+                    restarted = _trigger_restart(supervisor_pid_file, logger)
+                    next_run = None
                     break
-                time.sleep(min(delta, MAX_SLEEP_INTERVAL_SECONDS))
-
-            if server_pid_file and not _is_process_alive(_read_pid_from_file(server_pid_file)):
-                logger.info("Server process not running - postponing notifications until it comes back")
-                break
-
-            if event_type == "warn" and payload is not None:
-                logger.info("Announcing restart %s minutes before scheduled time", payload)
-                _announce(payload, next_run, logger, settings)
-            elif event_type == "restart":
-                logger.info("Scheduled restart window reached - notifying players and signalling supervisor")
-                _announce_now(next_run, logger, settings)
-                _trigger_restart(supervisor_pid_file, logger)
-                break
-
-        # Small delay before computing next window to avoid tight loops when server is down
-        time.sleep(POST_RESTART_DELAY_SECONDS)
+        finally:
+            if client is not None:
+                client.close()
+
+        # Small delay before computing next window to avoid tight loops when the
+        # server is down or the restart could not be triggered
+        if not restarted:
+            time.sleep(POST_RESTART_DELAY_SECONDS)
 
 
 __all__ = ["CronSchedule", "parse_warning_offsets", "run_scheduler"]
@@ -2,33 +2,81 @@
 
 from __future__ import annotations
 
+import os
+import posixpath
 import tarfile
 from pathlib import Path
 
 
+def _is_inside(path: str, dest_root: str) -> bool:
+    """Return True if normalized archive ``path`` stays within ``dest_root``.
+
+    Relative paths are taken relative to ``dest_root``; checks are purely
+    lexical so validation never touches the filesystem.
+    """
+    if posixpath.isabs(path):
+        return path == dest_root or path.startswith(dest_root.rstrip("/") + "/")
+    return path != ".." and not path.startswith("../")
+
+
+def _resolve_member(path: str, dest_root: str, real_parents: dict[str, str]) -> str:
+    """Return the real location normalized archive ``path`` maps to under ``dest_root``.
+
+    Symlinks already present in the destination are followed like
+    ``Path.resolve``. Each parent directory is resolved once per archive via
+    ``real_parents``; only the leaf needs its own ``lstat``.
+    """
+    parent, leaf = posixpath.split(path)
+    real_parent = real_parents.get(parent)
+    if real_parent is None:
+        real_parent = os.path.realpath(posixpath.join(dest_root, parent))
+        real_parents[parent] = real_parent
+    if leaf in ("", "."):
+        return real_parent
+    target = posixpath.join(real_parent, leaf)
+    if leaf == ".." or os.path.islink(target):
+        target = os.path.realpath(target)
+    return target
+
+
+def is_safe_member_path(path: str, dest_root: str, real_parents: dict[str, str]) -> bool:
+    """Return True if normalized archive ``path`` stays within ``dest_root``.
+
+    The lexical check rejects traversal outright; the resolved check catches
+    escapes through symlinks that already exist in the destination.
+    """
+    return _is_inside(path, dest_root) and _is_inside(
+        _resolve_member(path, dest_root, real_parents), dest_root
+    )
+
+
 def safe_extract_tar(tar: tarfile.TarFile, destination: Path) -> None:
     """Safely extract a tar archive, preventing path traversal."""
     dest_root = destination.resolve()
-    members = tar.getmembers()
-    for member in members:
+    root = dest_root.as_posix()
+    real_parents: dict[str, str] = {}
+    # Iterating reads headers lazily, so an unsafe member fails fast without
+    # first loading the rest of the archive's headers.
+    for member in tar:
         if member.isdev() or member.isfifo():
             raise RuntimeError(f"Unsupported tar special member detected: {member.name!r}")
 
-        member_path = (dest_root / member.name).resolve()
-        if member_path != dest_root and dest_root not in member_path.parents:
+        member_path = posixpath.normpath(member.name)
+        if not is_safe_member_path(member_path, root, real_parents):
             raise RuntimeError(f"Unsafe tar member path detected: {member.name!r}")
 
         if member.issym():
-            link_target = (member_path.parent / member.linkname).resolve()
-            if link_target != dest_root and dest_root not in link_target.parents:
-                raise RuntimeError(
-                    f"Unsafe tar link target detected: {member.name!r} -> {member.linkname!r}"
-                )
+            link_target = posixpath.normpath(
+                posixpath.join(posixpath.dirname(member_path), member.linkname)
+            )
         elif member.islnk():
-            link_target = (dest_root / member.linkname).resolve()
-            if link_target != dest_root and dest_root not in link_target.parents:
-                raise RuntimeError(
-                    f"Unsafe tar link target detected: {member.name!r} -> {member.linkname!r}"
-                )
+            link_target = posixpath.normpath(member.linkname)
+        else:
+            continue
+        if not is_safe_member_path(link_target, root, real_parents):
+            raise RuntimeError(
+                f"Unsafe tar link target detected: {member.name!r} -> {member.linkname!r}"
+            )
 
-    tar.extractall(dest_root, members=members)
+    # TarFile caches members as it iterates, so this list is already loaded.
+    tar.extractall(dest_root, members=tar.getmembers())
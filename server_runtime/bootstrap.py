@@ -11,6 +11,8 @@ from pathlib import Path
 
 ETC_MACHINE_ID_PATH = "/etc/machine-id"
 DBUS_MACHINE_ID_PATH = "/var/lib/dbus/machine-id"
+ETC_LOCALTIME_PATH = "/etc/localtime"
+ETC_TIMEZONE_PATH = "/etc/timezone"
 
 
 def configure_timezone(logger: logging.Logger) -> None:
@@ -35,18 +37,32 @@ def configure_timezone(logger: logging.Logger) -> None:
         logger.info("Not root; cannot update /etc/localtime. Using TZ='%s' only.", tz)
         return
 
+    # Leave /etc untouched when it already matches, avoiding a rewrite (and an
+    # overlayfs copy-up) on every container start.
+    localtime = Path(ETC_LOCALTIME_PATH)
     try:
-        localtime = Path("/etc/localtime")
-        if localtime.exists() or localtime.is_symlink():
-            localtime.unlink()
-        localtime.symlink_to(zoneinfo)
+        current_target = os.readlink(localtime)
     except OSError:
-        logger.warning("Failed updating /etc/localtime for '%s'.", tz)
-
+        current_target = None
+    if current_target != str(zoneinfo):
+        try:
+            if localtime.exists() or localtime.is_symlink():
+                localtime.unlink()
+            localtime.symlink_to(zoneinfo)
+        except OSError:
+            logger.warning("Failed updating /etc/localtime for '%s'.", tz)
+
+    timezone_file = Path(ETC_TIMEZONE_PATH)
+    timezone_content = f"{tz}\n"
     try:
-        Path("/etc/timezone").write_text(f"{tz}\n", encoding="utf-8")
-    except OSError:
-        logger.warning("Failed writing /etc/timezone for '%s'.", tz)
+        current_content = timezone_file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        current_content = None
+    if current_content != timezone_content:
+        try:
+            timezone_file.write_text(timezone_content, encoding="utf-8")
+        except OSError:
+            logger.warning("Failed writing /etc/timezone for '%s'.", tz)
 
     os.environ["TZ"] = tz
     logger.info("Configured timezone to '%s'.", tz)
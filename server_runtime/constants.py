@@ -38,12 +38,14 @@ PRIVS_DROPPED_ENV = "START_SERVER_PRIVS_DROPPED"
 
 PROTON_REPO = "GloriousEggroll/proton-ge-custom"
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 
 def env_bool(key: str, default: bool = False) -> bool:
     value = os.environ.get(key)
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _TRUTHY
 
 
 def env_int(key: str, default: int) -> int:
@@ -0,0 +1,152 @@
+"""In-process forwarding of the server log file to container stdout."""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import sys
+import threading
+from typing import Optional
+
+_IN_MODIFY = 0x00000002
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_READ_SIZE = 64 * 1024
+
+
+def _inotify_watch(directory: str) -> Optional[int]:
+    """Return a non-blocking inotify fd watching ``directory``, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (AttributeError, OSError, TypeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), _IN_MODIFY | _IN_MOVED_TO | _IN_CREATE) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class LogStreamer:
+    """Follow a log file by name and copy appended bytes to an output fd.
+
+    Behaves like ``tail -n 0 -F``: existing content is skipped, and a truncated
+    or replaced file is read again from the start. Runs on a daemon thread that
+    sleeps on inotify when available and polls otherwise.
+    """
+
+    def __init__(self, path: str, output_fd: Optional[int] = None, poll_interval: float = 1.0) -> None:
+        self.path = path
+        self.output_fd = sys.stdout.fileno() if output_fd is None else output_fd
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+        self._identity: Optional[tuple[int, int]] = None
+        self._inotify_fd: Optional[int] = None
+        stop_r, stop_w = os.pipe()
+        self._stop_r: Optional[int] = stop_r
+        self._stop_w: Optional[int] = stop_w
+        self._thread: Optional[threading.Thread] = None
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        self._open(at_end=True)
+        self._inotify_fd = _inotify_watch(os.path.dirname(self.path) or ".")
+        self._thread = threading.Thread(target=self._run, name="log-streamer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            if self._stop_w is not None:
+                os.write(self._stop_w, b"\0")
+            self._thread.join(timeout=max(self.poll_interval, 1.0) + 1.0)
+            # The thread closes the fds on its way out. If it is still running,
+            # leave them open so their numbers cannot be reused under it.
+            if self._thread.is_alive():
+                return
+            self._thread = None
+        self._close_fds()
+
+    def _close_fds(self) -> None:
+        for fd in (self._fd, self._inotify_fd, self._stop_r, self._stop_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._fd = self._inotify_fd = self._stop_r = self._stop_w = None
+
+    def _open(self, at_end: bool) -> None:
+        try:
+            fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            return
+        st = os.fstat(fd)
+        if at_end:
+            os.lseek(fd, 0, os.SEEK_END)
+        self._fd = fd
+        self._identity = (st.st_dev, st.st_ino)
+
+    def _run(self) -> None:
+        try:
+            self._follow()
+        finally:
+            self._close_fds()
+
+    def _follow(self) -> None:
+        watched = [self._stop_r] if self._inotify_fd is None else [self._stop_r, self._inotify_fd]
+        # inotify wakes us on writes; the timeout only guards against missed events.
+        timeout = self.poll_interval if self._inotify_fd is None else self.poll_interval * 5
+        while True:
+            ready, _, _ = select.select(watched, [], [], timeout)
+            if self._stop_r in ready:
+                break
+            if self._inotify_fd is not None and self._inotify_fd in ready:
+                self._drain_events()
+            self._pump()
+        self._pump()
+
+    def _drain_events(self) -> None:
+        try:
+            while os.read(self._inotify_fd, _READ_SIZE):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _pump(self) -> None:
+        try:
+            st = os.stat(self.path)
+            current = (st.st_dev, st.st_ino)
+        except OSError:
+            current = None
+
+        if self._fd is not None:
+            if os.fstat(self._fd).st_size < os.lseek(self._fd, 0, os.SEEK_CUR):
+                # Truncated in place; start over like tail -F.
+                os.lseek(self._fd, 0, os.SEEK_SET)
+            self._copy()
+            if current is not None and current != self._identity:
+                os.close(self._fd)
+                self._fd = None
+
+        if self._fd is None and current is not None:
+            self._open(at_end=False)
+            if self._fd is not None:
+                self._copy()
+
+    def _copy(self) -> None:
+        while True:
+            chunk = os.read(self._fd, _READ_SIZE)
+            if not chunk:
+                return
+            view = memoryview(chunk)
+            while view:
+                try:
+                    written = os.write(self.output_fd, view)
+                except OSError:
+                    return
+                view = view[written:]
@@ -10,14 +10,14 @@ _LEVEL_ALIASES = {
     "WARN": "WARNING",
     "FATAL": "CRITICAL",
 }
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
 
 def configure_runtime_logging() -> logging.Logger:
     """Configure runtime logger from ASA_LOG_LEVEL."""
     configured_level = (os.environ.get("ASA_LOG_LEVEL") or "INFO").upper()
     level_name = _LEVEL_ALIASES.get(configured_level, configured_level)
-    valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-    if level_name in valid_levels:
+    if level_name in _VALID_LEVELS:
         level = getattr(logging, level_name)
         invalid_level = None
     else:
@@ -33,6 +33,6 @@ def configure_runtime_logging() -> logging.Logger:
         logger.warning(
             "Invalid ASA_LOG_LEVEL %r; falling back to INFO. Valid values: %s.",
             invalid_level,
-            ", ".join(sorted(valid_levels)),
+            ", ".join(sorted(_VALID_LEVELS)),
         )
     return logger
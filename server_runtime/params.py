@@ -3,30 +3,37 @@
 from __future__ import annotations
 
 import logging
+import mmap
 import os
 import re
 import subprocess
-from pathlib import Path
+from typing import Optional
 
 from .constants import ASA_CTRL_BIN, DEFAULT_START_PARAMS, GAME_USER_SETTINGS_PATH
 
+_INI_ADMIN_PASSWORD_RE = re.compile(rb"(?m)^[ \t]*ServerAdminPassword[ \t]*=")
+
 
 def has_server_admin_password_in_params(params: str) -> bool:
     return "ServerAdminPassword=" in params
 
 
 def server_admin_password_in_ini() -> bool:
-    path = Path(GAME_USER_SETTINGS_PATH)
-    if not path.exists():
-        return False
-    pattern = re.compile(r"^[ \t]*ServerAdminPassword[ \t]*=")
+    # One scan over the mapped bytes instead of decoding and splitting the
+    # whole file into lines; a plain substring search rules out files without
+    # the key before the anchored regex runs.
     try:
-        for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-            if pattern.search(line):
-                return True
+        with open(GAME_USER_SETTINGS_PATH, "rb") as handle:
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    if data.find(b"ServerAdminPassword") == -1:
+                        return False
+                    return _INI_ADMIN_PASSWORD_RE.search(data) is not None
+            except ValueError:
+                # mmap rejects empty files.
+                return False
     except OSError:
         return False
-    return False
 
 
 def ensure_server_admin_password(logger: logging.Logger) -> str:
@@ -50,24 +57,48 @@ def ensure_server_admin_password(logger: logging.Logger) -> str:
     return params
 
 
-def inject_mods_param(base_params: str, logger: logging.Logger) -> str:
-    """Append dynamic mods string from asa-ctrl if present."""
+def _read_mods_string(logger: logging.Logger) -> Optional[str]:
+    """Return the mods parameter computed in-process, or None if asa_ctrl is unavailable."""
+    try:
+        from asa_ctrl.common.errors import AsaCtrlError
+        from asa_ctrl.core.mods import format_mod_list_for_server
+    except ImportError:
+        return None
+    try:
+        return format_mod_list_for_server()
+    except (AsaCtrlError, OSError, ValueError) as exc:
+        logger.warning("Failed to read mods database: %s; skipping dynamic mods injection.", exc)
+        return ""
+
+
+def _query_mods_string(logger: logging.Logger) -> str:
     try:
         result = subprocess.run(
             [ASA_CTRL_BIN, "mods-string"],
             check=False,
             capture_output=True,
             text=True,
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
         )
     except OSError as exc:
         logger.warning("Failed to query dynamic mods via asa-ctrl: %s", exc)
-        return base_params
+        return ""
 
     if result.returncode != 0:
         logger.warning("asa-ctrl mods-string exited with code %s; skipping dynamic mods injection.", result.returncode)
-        return base_params
+        return ""
+    return result.stdout or ""
 
-    mods = (result.stdout or "").strip()
+
+def inject_mods_param(base_params: str, logger: logging.Logger) -> str:
+    """Append dynamic mods string from asa-ctrl if present."""
+    # asa_ctrl ships next to this package, so the mods string is normally
+    # computed in-process; spawning `asa-ctrl mods-string` is only a fallback.
+    mods = _read_mods_string(logger)
+    if mods is None:
+        mods = _query_mods_string(logger)
+    mods = (mods or "").strip()
     if not mods:
         return base_params
     merged = f"{base_params} {mods}".strip()
@@ -9,7 +9,7 @@ import subprocess
 import sys
 import shlex
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from .constants import (
     CLUSTER_DIR,
@@ -22,21 +22,73 @@ from .constants import (
 )
 
 
-def _chown_path(path: Path) -> None:
+def _chown_path(path: Union[str, Path]) -> None:
+    # TARGET_UID/GID are numeric, so call os.chown directly; shutil.chown would
+    # redo its argument normalization on every file of a recursive pass.
     try:
-        shutil.chown(path, user=TARGET_UID, group=TARGET_GID, follow_symlinks=False)
-    except TypeError:
-        shutil.chown(path, user=TARGET_UID, group=TARGET_GID)
+        os.chown(path, TARGET_UID, TARGET_GID, follow_symlinks=False)
+    except NotImplementedError:
+        os.chown(path, TARGET_UID, TARGET_GID)
+
+
+def _is_target_owned(stat_result: os.stat_result) -> bool:
+    return stat_result.st_uid == TARGET_UID and stat_result.st_gid == TARGET_GID
 
 
 def _chown_if_possible(path: Path, recursive: bool) -> None:
-    if recursive:
-        for root, _, files in os.walk(path):
-            _chown_path(Path(root))
-            for name in files:
-                _chown_path(Path(root) / name)
-    else:
-        _chown_path(path)
+    # Entries that already have the target ownership are skipped: an lstat is
+    # cheaper than a chown, which also forces an overlayfs copy-up.
+    root = os.fspath(path)
+    root_owned = _is_target_owned(os.lstat(root))
+    if not recursive:
+        if not root_owned:
+            _chown_path(root)
+        return
+
+    # Iterative scandir walk: entry types come from the directory listing and
+    # paths stay plain strings, avoiding os.walk's lists and Path objects.
+    pending = [(root, root_owned)]
+    while pending:
+        directory, owned = pending.pop()
+        if not owned:
+            _chown_path(directory)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                owned = _is_target_owned(entry.stat(follow_symlinks=False))
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, owned))
+                elif not owned:
+                    _chown_path(entry.path)
+
+
+def _bulk_chown(paths: list[Path]) -> bool:
+    """Recursively chown ``paths`` with one coreutils ``chown -R`` call; return success."""
+    chown = shutil.which("chown")
+    if not chown:
+        return False
+    owner = f"{TARGET_UID}:{TARGET_GID}"
+    try:
+        result = subprocess.run(
+            [chown, "-R", "-h", "--", owner, *map(os.fspath, paths)],
+            check=False,
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
+        )
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def _write_marker(marker: Path) -> None:
+    """Create ``marker`` owned by the target user."""
+    fd = os.open(marker, os.O_CREAT | os.O_WRONLY, 0o644)
+    try:
+        os.fchown(fd, TARGET_UID, TARGET_GID)
+    except OSError:
+        os.close(fd)
+        marker.unlink(missing_ok=True)
+        raise
+    os.close(fd)
 
 
 def ensure_permissions_and_drop_privileges(logger: logging.Logger) -> None:
@@ -45,22 +97,49 @@ def ensure_permissions_and_drop_privileges(logger: logging.Logger) -> None:
         return
 
     dirs = [Path(STEAM_HOME_DIR), Path(STEAMCMD_DIR), Path(SERVER_FILES_DIR), Path(CLUSTER_DIR)]
+    first_run: list[Path] = []
     for directory in dirs:
-        directory.mkdir(parents=True, exist_ok=True)
-        marker = directory / ".permissions_set"
         try:
-            if not marker.exists():
-                logger.info(
-                    "Setting ownership recursively for %s to %s:%s (first run).",
-                    directory,
-                    TARGET_UID,
-                    TARGET_GID,
-                )
+            directory.mkdir(parents=True, exist_ok=True)
+            try:
+                os.stat(directory / ".permissions_set")
+                continue
+            except FileNotFoundError:
+                pass
+            logger.info(
+                "Setting ownership recursively for %s to %s:%s (first run).",
+                directory,
+                TARGET_UID,
+                TARGET_GID,
+            )
+            first_run.append(directory)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to normalize permissions for %s: %s", directory, exc)
+
+    # Markers are written only after the recursive pass succeeds, so a pass
+    # interrupted mid-way reruns on the next start.
+    completed: list[Path] = []
+    if first_run and _bulk_chown(first_run):
+        completed = first_run
+    elif first_run:
+        logger.info("chown -R unavailable or failed; walking directories in Python.")
+        for directory in first_run:
+            try:
                 _chown_if_possible(directory, recursive=True)
-                marker.touch(exist_ok=True)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to normalize permissions for %s: %s", directory, exc)
+            else:
+                completed.append(directory)
+
+    for directory in completed:
+        try:
+            _write_marker(directory / ".permissions_set")
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to record permissions marker for %s: %s", directory, exc)
+
+    for directory in dirs:
+        try:
             _chown_if_possible(directory, recursive=False)
-            if marker.exists():
-                _chown_if_possible(marker, recursive=False)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to normalize permissions for %s: %s", directory, exc)
 
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import logging
 import os
+import posixpath
 import zipfile
 from pathlib import Path
 
+from .archive_utils import is_safe_member_path
 from .constants import ASA_BINARY_DIR, ASA_BINARY_NAME, ASA_PLUGIN_BINARY_NAME
 
 
@@ -14,26 +16,33 @@ def resolve_launch_binary(logger: logging.Logger) -> str:
     """Extract AsaApi zip when present and choose launch executable."""
     binary_dir = Path(ASA_BINARY_DIR)
     archives = sorted(binary_dir.glob("AsaApi_*.zip"))
+    dest_root = str(binary_dir.resolve()) if archives else ""
     for archive in archives:
         logger.info("Extracting plugin loader archive %s", archive.name)
         with zipfile.ZipFile(archive, "r") as zip_ref:
-            dest_root = binary_dir.resolve()
-            for member in zip_ref.infolist():
-                member_target = (dest_root / member.filename).resolve()
-                if member_target != dest_root and dest_root not in member_target.parents:
+            members = zip_ref.infolist()
+            real_parents: dict[str, str] = {}
+            # Validate every member before extracting any. The resolved check
+            # covers the path ZipFile.extract writes to, which drops "", "."
+            # and ".." components, through symlinks already in the binary dir.
+            for member in members:
+                normalized = posixpath.normpath(member.filename)
+                extracted = "/".join(
+                    part for part in member.filename.split("/") if part not in ("", ".", "..")
+                )
+                if not (
+                    is_safe_member_path(normalized, dest_root, real_parents)
+                    and is_safe_member_path(extracted or ".", dest_root, real_parents)
+                ):
                     raise RuntimeError(f"Unsafe zip member path detected: {member.filename!r}")
-                if member.is_dir() or member.filename.endswith("/"):
-                    member_target.mkdir(parents=True, exist_ok=True)
-                    continue
-                member_target.parent.mkdir(parents=True, exist_ok=True)
-                with zip_ref.open(member, "r") as source, member_target.open("wb") as dest:
-                    while True:
-                        chunk = source.read(1024 * 1024)
-                        if not chunk:
-                            break
-                        dest.write(chunk)
+            for member in members:
+                member_target = zip_ref.extract(member, dest_root)
                 perm = member.external_attr >> 16
-                if perm:
+                # Directories keep the mode they are created with, as they did
+                # before extraction moved to ZipFile.extract: archives built on
+                # Windows carry no usable directory modes, and applying one
+                # could drop the search bit the server needs to enter them.
+                if perm and not member.is_dir():
                     try:
                         os.chmod(member_target, perm)
                     except OSError:
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
+import http.client
 import json
 import logging
 import os
+import posixpath
 import re
 import shutil
 import tarfile
 import tempfile
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
@@ -25,32 +31,96 @@ from .constants import (
 )
 
 _SAFE_VERSION_PATTERN = re.compile(r"^[0-9][0-9A-Za-z._-]*$")
+_ASSET_PROBE_WORKERS = 8
+_HTTP_HEADERS = {"User-Agent": "asa-server-runtime", "Accept": "*/*"}
+_HTTP_REDIRECTS = frozenset({301, 302, 303, 307, 308})
+
+# Idle keep-alive HTTPS connections per host, shared by the probe threads so
+# release lookups do not pay a TCP+TLS handshake per request.
+_CONNECTIONS: dict[str, list[http.client.HTTPSConnection]] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _open_connection(netloc: str, timeout: float) -> http.client.HTTPSConnection:
+    """Connect to ``netloc``, tunnelling through the HTTPS proxy urllib would use."""
+    proxy = urllib.request.getproxies().get("https")
+    host = urllib.parse.urlsplit(f"//{netloc}").hostname or netloc
+    if not proxy or urllib.request.proxy_bypass(host):
+        return http.client.HTTPSConnection(netloc, timeout=timeout)
+    proxy_parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    headers = {}
+    if proxy_parts.username:
+        credentials = urllib.parse.unquote(
+            f"{proxy_parts.username}:{proxy_parts.password or ''}"
+        ).encode()
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials).decode("ascii")
+    connection = http.client.HTTPSConnection(
+        proxy_parts.hostname, proxy_parts.port or 80, timeout=timeout
+    )
+    connection.set_tunnel(netloc, headers=headers)
+    return connection
+
+
+def _http_request(method: str, url: str, timeout: float = 10) -> tuple[int, bytes]:
+    """Send one request over a pooled keep-alive connection; redirects are not followed."""
+    parts = urllib.parse.urlsplit(url)
+    target = f"{parts.path or '/'}?{parts.query}" if parts.query else (parts.path or "/")
+    with _CONNECTIONS_LOCK:
+        idle = _CONNECTIONS.setdefault(parts.netloc, [])
+        connection = idle.pop() if idle else None
+
+    while True:
+        reused = connection is not None
+        if connection is None:
+            connection = _open_connection(parts.netloc, timeout)
+        try:
+            connection.request(method, target, headers=_HTTP_HEADERS)
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            connection = None
+            if reused:
+                # The server closed an idle keep-alive connection; retry fresh.
+                continue
+            raise
+        break
+
+    if response.will_close:
+        connection.close()
+    else:
+        with _CONNECTIONS_LOCK:
+            _CONNECTIONS.setdefault(parts.netloc, []).append(connection)
+    return response.status, body
 
 
 def _fetch_json(url: str) -> Optional[Any]:
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:  # noqa: S310
-            return json.loads(response.read().decode("utf-8"))
-    except (urllib.error.URLError, TimeoutError, ValueError):
+        status, body = _http_request("GET", url)
+        if status in _HTTP_REDIRECTS:
+            with urllib.request.urlopen(url, timeout=10) as response:  # noqa: S310
+                body = response.read()
+        elif status != 200:
+            return None
+        return json.loads(body.decode("utf-8"))
+    except (OSError, http.client.HTTPException, ValueError):
         return None
 
 
 def _asset_exists(url: str) -> bool:
-    request = urllib.request.Request(url, method="HEAD")
     try:
-        with urllib.request.urlopen(request, timeout=10):  # noqa: S310
-            return True
-    except urllib.error.HTTPError as exc:
-        if exc.code == 405:
-            # Some servers do not support HEAD.
-            try:
-                with urllib.request.urlopen(url, timeout=10):  # noqa: S310
-                    return True
-            except urllib.error.URLError:
-                return False
-        return False
-    except urllib.error.URLError:
+        status, _body = _http_request("HEAD", url)
+    except (OSError, http.client.HTTPException):
         return False
+    if status == 405:
+        # Some servers do not support HEAD.
+        try:
+            with urllib.request.urlopen(url, timeout=10):  # noqa: S310
+                return True
+        except urllib.error.URLError:
+            return False
+    # GitHub answers release downloads with a redirect to the storage host.
+    return 200 <= status < 300 or status in _HTTP_REDIRECTS
 
 
 def _check_release_assets(version: str) -> bool:
@@ -81,11 +151,18 @@ def find_latest_release_with_assets(skip_version: Optional[str] = None) -> Optio
         if not isinstance(payload, list):
             continue
         tags = [item.get("tag_name", "") for item in payload if isinstance(item, dict)]
-        for version in _extract_versions(tags):
-            if skip_version and version == skip_version:
-                continue
-            if _check_release_assets(version):
-                return version
+        candidates = [v for v in _extract_versions(tags) if not (skip_version and v == skip_version)]
+        if not candidates:
+            continue
+        # Probe a page's releases concurrently; results are consumed in release
+        # order so the newest release with assets still wins.
+        executor = ThreadPoolExecutor(max_workers=min(_ASSET_PROBE_WORKERS, len(candidates)))
+        try:
+            for version, available in zip(candidates, executor.map(_check_release_assets, candidates)):
+                if available:
+                    return version
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     return None
 
 
@@ -123,32 +200,39 @@ def resolve_proton_version(logger: logging.Logger) -> str:
     return version
 
 
-def _download_file(url: str, destination: Path) -> None:
+def _download_file(url: str, destination: Path, digest: Optional[Any] = None) -> None:
+    """Stream ``url`` to ``destination``, feeding ``digest`` with each chunk if given."""
     with urllib.request.urlopen(url, timeout=30) as response:  # noqa: S310
         with destination.open("wb") as handle:
-            shutil.copyfileobj(response, handle, length=1024 * 1024)
+            if digest is None:
+                shutil.copyfileobj(response, handle, length=1024 * 1024)
+                return
+            # Hashing while downloading avoids re-reading the archive to verify it.
+            for chunk in iter(lambda: response.read(1024 * 1024), b""):
+                handle.write(chunk)
+                digest.update(chunk)
 
 
-def _verify_sha512(archive_path: Path, checksum_path: Path) -> bool:
+def _verify_sha512(archive_path: Path, checksum_path: Path, digest: Optional[Any] = None) -> bool:
     checksums = checksum_path.read_text(encoding="utf-8", errors="ignore").splitlines()
+    archive_name = archive_path.name
     expected = ""
     for line in checksums:
-        parts = line.strip().split(maxsplit=1)
+        parts = line.split(maxsplit=1)
         if len(parts) != 2:
             continue
-        checksum_value, checksum_name = parts[0].strip(), parts[1].strip()
-        if checksum_name.startswith("*"):
-            checksum_name = checksum_name[1:]
-        if Path(checksum_name).name == archive_path.name:
-            expected = checksum_value
+        checksum_name = parts[1].strip().removeprefix("*")
+        if posixpath.basename(checksum_name) == archive_name:
+            expected = parts[0]
             break
     if not expected:
         return False
 
-    digest = hashlib.sha512()
-    with archive_path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
+    if digest is None:
+        digest = hashlib.sha512()
+        with archive_path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
     return digest.hexdigest().lower() == expected.lower()
 
 
@@ -167,15 +251,16 @@ def install_proton_if_needed(version: str, logger: logging.Logger) -> str:
         archive = tmp / f"{proton_dir_name}.tar.gz"
         checksum = tmp / f"{proton_dir_name}.sha512sum"
         archive_url = f"{base}/{archive.name}"
+        digest = hashlib.sha512()
         try:
-            _download_file(archive_url, archive)
+            _download_file(archive_url, archive, digest)
         except (urllib.error.URLError, OSError) as exc:
             raise RuntimeError(f"Failed to download Proton archive from {archive_url}") from exc
 
         checksum_ok = False
         try:
             _download_file(f"{base}/{checksum.name}", checksum)
-            checksum_ok = _verify_sha512(archive, checksum)
+            checksum_ok = _verify_sha512(archive, checksum, digest)
         except urllib.error.URLError:
             checksum_ok = False
 
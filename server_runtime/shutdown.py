@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 import signal
 import subprocess
-import time
 from typing import Optional
 
 from .constants import ASA_CTRL_BIN
@@ -19,6 +18,7 @@ def send_saveworld(logger: logging.Logger) -> bool:
             check=False,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            close_fds=False,
         )
         ok = result.returncode == 0
     except OSError:
@@ -43,11 +43,9 @@ def stop_server_process(
 
     logger.info("Sending SIGTERM to server process PID %s", server_process.pid)
     server_process.terminate()
-    deadline = time.time() + max(shutdown_timeout, 1)
-    while server_process.poll() is None and time.time() < deadline:
-        time.sleep(1)
-
-    if server_process.poll() is None:
+    try:
+        server_process.wait(timeout=max(shutdown_timeout, 1))
+    except subprocess.TimeoutExpired:
         logger.warning(
             "Server did not stop within %ss; sending SIGKILL to PID %s",
             shutdown_timeout,
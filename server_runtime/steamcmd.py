@@ -50,4 +50,4 @@ def update_server_files(logger: logging.Logger) -> None:
         "validate",
         "+quit",
     ]
-    subprocess.run(command, cwd=STEAMCMD_DIR, check=True)
+    subprocess.run(command, cwd=STEAMCMD_DIR, check=True, close_fds=False)
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import logging
 import os
+import select
 import shlex
 import signal
+import stat
 import subprocess
-import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .bootstrap import configure_timezone, ensure_machine_id, maybe_debug_hold
 from .constants import (
@@ -25,12 +26,29 @@ from .constants import (
     RuntimeSettings,
 )
 from .logging_utils import configure_runtime_logging
-from .params import ensure_nosteam_flag, ensure_server_admin_password, inject_mods_param
 from .permissions import ensure_permissions_and_drop_privileges, safe_kill_process
-from .plugins import resolve_launch_binary
-from .proton import ensure_proton_compat_data, install_proton_if_needed, resolve_proton_version
 from .shutdown import send_saveworld, signal_name, stop_server_process
-from .steamcmd import ensure_steamcmd, update_server_files
+
+if TYPE_CHECKING:
+    from .log_streamer import LogStreamer
+
+
+_SHUTDOWN_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGTERM", "SIGINT", "SIGHUP") if hasattr(signal, name)
+)
+_RESTART_SIGNALS = tuple(getattr(signal, name) for name in ("SIGUSR1",) if hasattr(signal, name))
+
+
+def _write_pid_file(path: Path, pid: int) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        os.write(fd, f"{pid}\n".encode("ascii"))
+    finally:
+        os.close(fd)
+
+
+def _wake_only(_sig: int, _frame) -> None:
+    """Signals are dispatched from the wakeup fd; the handler only has to exist."""
 
 
 class ServerSupervisor:
@@ -40,26 +58,35 @@ class ServerSupervisor:
         self.settings = settings
         self.logger = logger
         self.server_process: Optional[subprocess.Popen] = None
-        self.log_streamer_process: Optional[subprocess.Popen] = None
+        self.log_streamer: Optional[LogStreamer] = None
         self.restart_scheduler_process: Optional[subprocess.Popen] = None
         self.shutdown_in_progress = False
         self.supervisor_exit_requested = False
         self.restart_requested = False
+        self._wakeup_fd: Optional[int] = None
+        self._pid_path = Path(PID_FILE)
+        self._supervisor_pid_path = Path(SUPERVISOR_PID_FILE)
 
     def register_supervisor_pid(self) -> None:
-        Path(SUPERVISOR_PID_FILE).write_text(f"{os.getpid()}\n", encoding="utf-8")
+        _write_pid_file(self._supervisor_pid_path, os.getpid())
 
     def start_restart_scheduler(self) -> None:
         cron = (os.environ.get("SERVER_RESTART_CRON") or "").strip()
         if not cron:
             return
-        if not os.path.isfile(ASA_CTRL_BIN):
+        # One stat answers both questions; exec itself reports a missing
+        # execute permission for this user (see the Popen error below).
+        try:
+            mode = os.stat(ASA_CTRL_BIN).st_mode
+        except OSError:
+            mode = 0
+        if not stat.S_ISREG(mode):
             self.logger.warning(
                 "Restart scheduler requested but asa-ctrl path '%s' is not a regular file.",
                 ASA_CTRL_BIN,
             )
             return
-        if not os.access(ASA_CTRL_BIN, os.X_OK):
+        if not mode & 0o111:
             self.logger.warning(
                 "Restart scheduler requested but asa-ctrl binary '%s' is not executable.",
                 ASA_CTRL_BIN,
@@ -72,7 +99,19 @@ class ServerSupervisor:
         os.environ["SERVER_RESTART_WARNINGS"] = warnings or "30,5,1"
         os.environ["ASA_SUPERVISOR_PID_FILE"] = SUPERVISOR_PID_FILE
         os.environ["ASA_SERVER_PID_FILE"] = PID_FILE
-        self.restart_scheduler_process = subprocess.Popen([ASA_CTRL_BIN, "restart-scheduler"])
+        try:
+            # close_fds=False with an absolute path lets subprocess use posix_spawn
+            # (vfork semantics) instead of fork+exec of the supervisor.
+            self.restart_scheduler_process = subprocess.Popen(
+                [ASA_CTRL_BIN, "restart-scheduler"],
+                close_fds=False,
+            )
+        except PermissionError:
+            self.logger.warning(
+                "Restart scheduler requested but asa-ctrl binary '%s' is not executable.",
+                ASA_CTRL_BIN,
+            )
+            return
         self.logger.info(
             "Started restart scheduler (PID %s) with cron '%s'.",
             self.restart_scheduler_process.pid,
@@ -88,7 +127,8 @@ class ServerSupervisor:
                 runtime_dir = f"/tmp/xdg-runtime-{uid}"
         else:
             candidate = f"/run/user/{uid}"
-            if Path(candidate).exists() and os.access(candidate, os.W_OK):
+            # os.access is False for a missing path, so no separate exists().
+            if os.access(candidate, os.W_OK):
                 runtime_dir = candidate
             else:
                 runtime_dir = f"/tmp/xdg-runtime-{uid}"
@@ -110,13 +150,14 @@ class ServerSupervisor:
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / "ShooterGame.log"
         log_file.touch(exist_ok=True)
-        if self.log_streamer_process and self.log_streamer_process.poll() is None:
+        if self.log_streamer and self.log_streamer.is_alive():
             return
-        self.log_streamer_process = subprocess.Popen(
-            ["tail", "-n", "0", "-F", str(log_file)],
-            stdout=sys.stdout,
-            stderr=subprocess.DEVNULL,
-        )
+        # Launch-only like the imports in _launch_server_once; pulls in ctypes and threading.
+        from .log_streamer import LogStreamer
+
+        # Forwarded in-process instead of through a `tail -n 0 -F` child.
+        self.log_streamer = LogStreamer(str(log_file))
+        self.log_streamer.start()
 
     def _build_launch_command(self, proton_dir_name: str, launch_binary: str, params: str) -> list[str]:
         proton_path = str(Path(STEAM_COMPAT_DIR) / proton_dir_name / "proton")
@@ -127,6 +168,13 @@ class ServerSupervisor:
         return command
 
     def _launch_server_once(self) -> int:
+        # Launch-only modules are imported here so the root process, which
+        # re-execs after dropping privileges, never loads them.
+        from .params import ensure_nosteam_flag, ensure_server_admin_password, inject_mods_param
+        from .plugins import resolve_launch_binary
+        from .proton import ensure_proton_compat_data, install_proton_if_needed, resolve_proton_version
+        from .steamcmd import update_server_files
+
         update_server_files(self.logger)
         params = ensure_server_admin_password(self.logger)
         version = resolve_proton_version(self.logger)
@@ -142,8 +190,40 @@ class ServerSupervisor:
         self.logger.info("Start parameters: %s", params)
         command = self._build_launch_command(proton_dir_name, launch_binary, params)
         self.server_process = subprocess.Popen(command, cwd=ASA_BINARY_DIR)
-        Path(PID_FILE).write_text(f"{self.server_process.pid}\n", encoding="utf-8")
-        return self.server_process.wait()
+        _write_pid_file(self._pid_path, self.server_process.pid)
+        return self._wait_for_server()
+
+    def _wait_for_server(self) -> int:
+        """Block until the server exits, dispatching signals from the wakeup fd meanwhile."""
+        process = self.server_process
+        try:
+            pidfd: Optional[int] = os.pidfd_open(process.pid)
+        except (AttributeError, OSError):
+            # No pidfd support (Python < 3.9, Linux < 5.3) or already reaped.
+            pidfd = None
+        if pidfd is None and self._wakeup_fd is None:
+            return process.wait()
+
+        poller = select.poll()
+        if self._wakeup_fd is not None:
+            poller.register(self._wakeup_fd, select.POLLIN)
+        if pidfd is not None:
+            poller.register(pidfd, select.POLLIN)
+        try:
+            while True:
+                # Without a pidfd, fall back to checking the child once a second.
+                ready = {fd for fd, _event in poller.poll(None if pidfd is not None else 1000)}
+                if self._wakeup_fd in ready:
+                    self._dispatch_signals()
+                if pidfd is not None:
+                    if pidfd in ready:
+                        break
+                elif process.poll() is not None:
+                    break
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+        return process.wait()
 
     def _perform_shutdown_sequence(self, sig: int, purpose: str) -> None:
         if self.shutdown_in_progress:
@@ -165,34 +245,81 @@ class ServerSupervisor:
             time.sleep(max(self.settings.shutdown_saveworld_delay, 0))
         stop_server_process(self.server_process, self.settings.shutdown_timeout, self.logger)
 
-    def _handle_shutdown_signal(self, sig: int, _frame) -> None:
-        self.supervisor_exit_requested = True
-        self._perform_shutdown_sequence(sig, "container shutdown")
+    def _sleep_interruptibly(self, seconds: float) -> None:
+        """Sleep up to ``seconds``, handling signals as they arrive and stopping on exit."""
+        if self._wakeup_fd is None:
+            time.sleep(seconds)
+            return
+        poller = select.poll()
+        poller.register(self._wakeup_fd, select.POLLIN)
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if poller.poll(remaining * 1000):
+                self._dispatch_signals()
+                if self.supervisor_exit_requested:
+                    return
+
+    def _handle_signal(self, sig: int) -> None:
+        if sig in _RESTART_SIGNALS:
+            self.restart_requested = True
+            self._perform_shutdown_sequence(sig, "scheduled restart")
+        else:
+            self.supervisor_exit_requested = True
+            self._perform_shutdown_sequence(sig, "container shutdown")
 
-    def _handle_restart_signal(self, sig: int, _frame) -> None:
-        self.restart_requested = True
-        self._perform_shutdown_sequence(sig, "scheduled restart")
+    def _dispatch_signals(self) -> None:
+        """Handle every signal recorded on the wakeup fd since the last call."""
+        if self._wakeup_fd is None:
+            return
+        while True:
+            try:
+                pending = os.read(self._wakeup_fd, 64)
+            except BlockingIOError:
+                return
+            if not pending:
+                return
+            for sig in pending:
+                self._handle_signal(sig)
 
     def _cleanup_after_run(self) -> None:
         safe_kill_process(self.server_process)
-        Path(PID_FILE).unlink(missing_ok=True)
+        self._pid_path.unlink(missing_ok=True)
         self.server_process = None
 
     def cleanup(self) -> None:
         safe_kill_process(self.server_process)
-        safe_kill_process(self.log_streamer_process)
+        if self.log_streamer is not None:
+            self.log_streamer.stop()
+            self.log_streamer = None
         safe_kill_process(self.restart_scheduler_process)
-        Path(PID_FILE).unlink(missing_ok=True)
-        Path(SUPERVISOR_PID_FILE).unlink(missing_ok=True)
+        self._pid_path.unlink(missing_ok=True)
+        self._supervisor_pid_path.unlink(missing_ok=True)
 
     def run(self) -> int:
-        signal.signal(signal.SIGTERM, self._handle_shutdown_signal)
-        signal.signal(signal.SIGINT, self._handle_shutdown_signal)
-        if hasattr(signal, "SIGHUP"):
-            signal.signal(signal.SIGHUP, self._handle_shutdown_signal)
-        if hasattr(signal, "SIGUSR1"):
-            signal.signal(signal.SIGUSR1, self._handle_restart_signal)
-
+        # Signals only write their number to a pipe; the supervisor acts on
+        # them from its wait loops, in normal control flow.
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        previous_handlers = {
+            sig: signal.signal(sig, _wake_only) for sig in _SHUTDOWN_SIGNALS + _RESTART_SIGNALS
+        }
+        previous_wakeup_fd = signal.set_wakeup_fd(write_fd, warn_on_full_buffer=False)
+        self._wakeup_fd = read_fd
+        try:
+            return self._run_loop()
+        finally:
+            signal.set_wakeup_fd(previous_wakeup_fd)
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler if handler is not None else signal.SIG_DFL)
+            self._wakeup_fd = None
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def _run_loop(self) -> int:
         while True:
             exit_code = 1
             try:
@@ -202,6 +329,7 @@ class ServerSupervisor:
                 self.logger.exception("Unhandled exception during server run; will attempt restart.")
             finally:
                 self._cleanup_after_run()
+            self._dispatch_signals()
 
             if self.supervisor_exit_requested:
                 self.logger.info("Supervisor exit requested; terminating with code %s.", exit_code)
@@ -220,7 +348,10 @@ class ServerSupervisor:
                 )
             self.restart_requested = False
             self.shutdown_in_progress = False
-            time.sleep(max(self.settings.server_restart_delay, 0))
+            self._sleep_interruptibly(max(self.settings.server_restart_delay, 0))
+            if self.supervisor_exit_requested:
+                self.logger.info("Supervisor exit requested; terminating with code %s.", exit_code)
+                return exit_code
 
 
 def main() -> None:
@@ -233,6 +364,8 @@ def main() -> None:
     maybe_debug_hold(settings.enable_debug, logger)
     ensure_permissions_and_drop_privileges(logger)
 
+    from .steamcmd import ensure_steamcmd
+
     ensure_steamcmd(logger)
 
     supervisor = ServerSupervisor(settings, logger)
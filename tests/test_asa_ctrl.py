@@ -7,6 +7,7 @@ Run with: `py -m tests.test_asa_ctrl` or `py tests/test_asa_ctrl.py`.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import sys
@@ -32,7 +33,8 @@ from asa_ctrl.cli_helpers import exit_with_error, map_exception_to_exit_code  #
 from asa_ctrl.cli_commands.mods_command import ModsCommand  # noqa: E402
 from asa_ctrl.cli_commands.rcon_command import RconCommand  # noqa: E402
 from asa_ctrl.cli import main as cli_main  # noqa: E402
-from asa_ctrl.core.rcon import RconClient, RconPacket, RconPacketCodec, execute_rcon_command  # noqa: E402
+from asa_ctrl.core.rcon import AsyncRconClient, RconClient, RconPacket, RconPacketCodec, execute_rcon_command  # noqa: E402
+import asa_ctrl.core.rcon as rcon_module  # noqa: E402
 from asa_ctrl.common.errors import (  # noqa: E402
     RconPortNotFoundError,
     RconPasswordNotFoundError,
@@ -364,6 +366,13 @@ def test_rcon_validation():
     # Test IP validation
     assert client._validate_ip('127.0.0.1') == '127.0.0.1'
     assert client._validate_ip('localhost') == 'localhost'
+    assert client._validate_ip('::1') == '::1'
+    assert client._validate_ip('asa-server_1.example.com') == 'asa-server_1.example.com'
+
+    with pytest.raises(ValueError):
+        client._validate_ip('bad host;rm')
+    with pytest.raises(ValueError):
+        client._validate_ip('localhost\n')
 
     try:
         client._validate_ip('')
@@ -378,8 +387,9 @@ def test_rcon_validation():
         pass  # Expected
 
     # Test command validation
-    assert client._validate_command('saveworld') == 'saveworld'
-    assert client._validate_command('  broadcast Hello  ') == 'broadcast Hello'
+    assert client._validate_command('saveworld') == ('saveworld', b'saveworld')
+    assert client._validate_command('  broadcast Hello  ') == ('broadcast Hello', b'broadcast Hello')
+    assert client._validate_command('say \u00e9') == ('say \u00e9', 'say \u00e9'.encode('utf-8'))
 
     try:
         client._validate_command('')
@@ -457,6 +467,12 @@ def test_rcon_connect_propagates_auth_failure():
         def connect(self, address):  # pragma: no cover - trivial connector
             self.address = address
 
+        def setsockopt(self, *args):  # pragma: no cover - trivial setter
+            pass
+
+        def getsockopt(self, *args):  # pragma: no cover - trivial getter
+            return 0
+
         def close(self):  # pragma: no cover - trivial closer
             self.closed = True
 
@@ -550,20 +566,28 @@ def test_rcon_with_retry_resets_state(monkeypatch):
 
     monkeypatch.setattr(time, "sleep", lambda _value: None)
     with pytest.raises(RconTimeoutError):
-        client._with_retry(fail_once)
+        client._with_retry(fail_once, reconnect=False)
     assert client._connected is False
     assert client._authenticated is False
 
 
-def test_rcon_receive_exact_reads_full_buffer():
+def test_rcon_fill_rx_reads_until_enough_bytes_are_buffered():
     from unittest.mock import Mock
     client = RconClient.__new__(RconClient)
 
+    chunks = [b"ab", b"cd"]
+
+    def fake_recv_into(view):
+        chunk = chunks.pop(0)
+        view[:len(chunk)] = chunk
+        return len(chunk)
+
     mock_socket = Mock()
-    mock_socket.recv.side_effect = [b"ab", b"cd"]
+    mock_socket.recv_into.side_effect = fake_recv_into
     object.__setattr__(client, 'socket', mock_socket)
-    data = client._receive_exact(4)
-    assert data == b"abcd"
+    client._fill_rx(4)
+    assert bytes(client._get_rx_buffer()[client._rx_start:client._rx_end]) == b"abcd"
+    assert mock_socket.recv_into.call_count == 2
 
 
 def test_rcon_execute_command_raises_on_invalid_command():
@@ -572,26 +596,484 @@ def test_rcon_execute_command_raises_on_invalid_command():
         client.execute_command("")
 
 
+class DummyRconClient:
+    """Stand-in for RconClient that records every instance execute_rcon_command creates."""
+
+    instances: list = []
+    fail = False  # Set per instance, or on the class to fail every new client
+
+    def __init__(self, server_ip='127.0.0.1', *_args, **_kwargs):
+        self.server_ip = server_ip
+        self.port = 27020
+        self.connected = False
+        self.connects = 0
+        self.commands = []
+        self.instances.append(self)
+
+    def is_connected(self):
+        return self.connected
+
+    def connect(self):
+        self.connects += 1
+        self.connected = True
+
+    def close(self):
+        self.connected = False
+
+    def execute_command(self, command):
+        self.commands.append(command)
+        if self.fail:
+            raise RconConnectionError("Connection closed by remote host")
+        return command
+
+
+def _use_dummy_rcon_client(monkeypatch):
+    """Patch RconClient with DummyRconClient and return its instance list."""
+    instances = []
+    monkeypatch.setattr(DummyRconClient, "instances", instances)
+    monkeypatch.setattr("asa_ctrl.core.rcon.RconClient", DummyRconClient)
+    RconClient.shutdown_pool()
+    return instances
+
+
 def test_execute_rcon_command_uses_client(monkeypatch):
-    responses = []
+    clients = _use_dummy_rcon_client(monkeypatch)
+    try:
+        assert execute_rcon_command("listplayers") == "listplayers"
+        assert execute_rcon_command("saveworld") == "saveworld"
+    finally:
+        RconClient.shutdown_pool()
+    assert clients[0].commands == ["listplayers", "saveworld"]
+    assert sum(client.connects for client in clients) == 1
 
-    class DummyClient:
-        def __init__(self, *_args, **_kwargs):
-            pass
 
-        def __enter__(self):
-            return self
+def test_execute_rcon_command_reconnects_stale_client(monkeypatch):
+    clients = _use_dummy_rcon_client(monkeypatch)
+    try:
+        execute_rcon_command("listplayers")
+        clients[0].fail = True
+        assert execute_rcon_command("listplayers") == "listplayers"
+        assert rcon_module._pool_get(("127.0.0.1", 27020)) is clients[-1]
+    finally:
+        RconClient.shutdown_pool()
+    assert clients[0].connected is False
+
+
+def test_execute_rcon_command_does_not_retry_fresh_client_failure(monkeypatch):
+    clients = _use_dummy_rcon_client(monkeypatch)
+    monkeypatch.setattr(DummyRconClient, "fail", True)
+    try:
+        with pytest.raises(RconConnectionError):
+            execute_rcon_command("saveworld")
+    finally:
+        RconClient.shutdown_pool()
+    assert len(clients) == 1
+    assert clients[0].connected is False
+
+
+def test_execute_rcon_command_discards_idle_pooled_clients(monkeypatch):
+    clients = _use_dummy_rcon_client(monkeypatch)
+    try:
+        execute_rcon_command("listplayers")
+        pooled = clients[0]
+        pooled._last_used -= rcon_module.POOL_MAX_IDLE_SECONDS + 1
+        execute_rcon_command("listplayers")
+    finally:
+        RconClient.shutdown_pool()
+    assert pooled.connected is False
+    assert clients[-1].connected is False  # closed by shutdown_pool
+
+
+def test_rcon_packet_ids_are_unique_and_increasing():
+    client = RconClient(server_ip='127.0.0.1', port=27020, password='secret', retry_count=0)
+    sent = []
+
+    class DummySocket:
+        def settimeout(self, value):
+            self.timeout = value
+
+        def sendall(self, data):
+            sent.append(data)
+
+    client.socket = DummySocket()
+    client._connected = True
+    codec = RconPacketCodec(4096, 12)
+    client._receive_full_packet = lambda: codec.encode(0, RconPacketTypes.RESPONSE_VALUE, "ok")
+
+    client._send_packet("saveworld", RconPacketTypes.EXEC_COMMAND)
+    client._send_packet("listplayers", RconPacketTypes.EXEC_COMMAND)
+
+    ids = [codec.decode(packet).id for packet in sent]
+    assert ids == [1, 2]
+
+
+def test_rcon_execute_commands_pipelines_and_matches_ids():
+    codec = RconPacketCodec(4096, 12)
+
+    class PipelineSocket:
+        def __init__(self):
+            self.sends = []
+            self.buffer = b""
+
+        def settimeout(self, value):
+            self.timeout = value
+
+        def sendall(self, data):
+            self.sends.append(data)
+            packets = []
+            offset = 0
+            while offset < len(data):
+                size = int.from_bytes(data[offset:offset + 4], "little")
+                packets.append(codec.decode(data[offset:offset + 4 + size]))
+                offset += 4 + size
+            # Reply out of order to exercise ID matching
+            for packet in reversed(packets):
+                self.buffer += codec.encode(packet.id, RconPacketTypes.RESPONSE_VALUE, f"re:{packet.body}")
+
+        def recv_into(self, view):
+            size = min(len(view), len(self.buffer))
+            view[:size] = self.buffer[:size]
+            self.buffer = self.buffer[size:]
+            return size
+
+    client = RconClient(server_ip='127.0.0.1', port=27020, password='secret', retry_count=0)
+    client.socket = PipelineSocket()
+    client._connected = True
+    client._authenticated = True
+
+    assert client.execute_commands(["saveworld", " listplayers "]) == ["re:saveworld", "re:listplayers"]
+    assert len(client.socket.sends) == 1
+    assert client.execute_commands([]) == []
+
+
+def test_rcon_receive_full_packet_handles_partial_reads():
+    codec = RconPacketCodec(4096, 12)
+    packet = codec.encode(7, RconPacketTypes.RESPONSE_VALUE, "Hello")
+
+    class ChunkedSocket:
+        def __init__(self, data):
+            self.data = data
+
+        def recv_into(self, view):
+            # Deliver at most three bytes per call
+            size = min(len(view), len(self.data), 3)
+            view[:size] = self.data[:size]
+            self.data = self.data[size:]
+            return size
+
+    client = RconClient.__new__(RconClient)
+    client.socket = ChunkedSocket(packet)
+    assert client._receive_full_packet() == packet
+
+
+def test_rcon_identify_caches_ini_lookup_until_modified(tmp_path, monkeypatch):
+    ini_path = tmp_path / "GameUserSettings.ini"
+    ini_path.write_text("[ServerSettings]\nServerAdminPassword=first\n", encoding="utf-8")
+    settings = AsaSettings({"ASA_GAME_USER_SETTINGS_PATH": str(ini_path)})
+
+    parses = []
+    original_parse = rcon_module.IniConfigHelper.parse_ini
+
+    def counting_parse(path):
+        parses.append(path)
+        return original_parse(path)
 
-        def __exit__(self, *_exc):
-            return False
+    monkeypatch.setattr(rcon_module.IniConfigHelper, "parse_ini", staticmethod(counting_parse))
+    rcon_module._cached_setting.cache_clear()
 
-        def execute_command(self, command):
-            responses.append(command)
-            return "ok"
+    assert RconClient(port=27020, settings=settings).password == "first"
+    assert RconClient(port=27020, settings=settings).password == "first"
+    assert len(parses) == 1
+
+    ini_path.write_text("[ServerSettings]\nServerAdminPassword=second\n", encoding="utf-8")
+    stat = ini_path.stat()
+    os.utime(ini_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert RconClient(port=27020, settings=settings).password == "second"
+
+
+def test_rcon_receive_full_packet_buffers_queued_packets():
+    codec = RconPacketCodec(4096, 12)
+    first = codec.encode(1, RconPacketTypes.RESPONSE_VALUE, "one")
+    second = codec.encode(2, RconPacketTypes.RESPONSE_VALUE, "two")
+
+    class CountingSocket:
+        def __init__(self, data):
+            self.data = data
+            self.calls = 0
+
+        def recv_into(self, view):
+            self.calls += 1
+            size = min(len(view), len(self.data))
+            view[:size] = self.data[:size]
+            self.data = self.data[size:]
+            return size
+
+    client = RconClient.__new__(RconClient)
+    client.socket = CountingSocket(first + second)
+    assert client._receive_full_packet() == first
+    assert client._receive_full_packet() == second
+    assert client.socket.calls == 1
+
+
+def test_rcon_auth_packet_is_reused():
+    client = RconClient(server_ip='127.0.0.1', port=27020, password='secret', retry_count=0)
+    first = client._get_auth_packet('secret')
+    assert client._get_auth_packet('secret') is first
+    assert RconPacketCodec(4096, 12).decode(first).body == 'secret'
+
+
+def test_rcon_configure_socket_sets_nodelay_and_keepalive():
+    import socket as socket_module
+
+    class OptionSocket:
+        def __init__(self):
+            self.options = {}
+
+        def setsockopt(self, level, option, value):
+            self.options[(level, option)] = value
+
+        def getsockopt(self, level, option):
+            return self.options.get((level, option), 0)
+
+    client = RconClient(server_ip='127.0.0.1', port=27020, password='secret', retry_count=0)
+    client.socket = OptionSocket()
+    client._configure_socket()
+    options = client.socket.options
+    assert options[(socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY)] == 1
+    assert options[(socket_module.SOL_SOCKET, socket_module.SO_KEEPALIVE)] == 1
+    assert options[(socket_module.SOL_SOCKET, socket_module.SO_RCVBUF)] == client.MAX_PACKET_SIZE * 4
+
+
+def test_rcon_with_retry_backoff_is_capped_and_skipped_for_packet_errors(monkeypatch):
+    client = RconClient.__new__(RconClient)
+    client.retry_count = 3
+    client.retry_delay = 1.0
+    client.socket = None
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    def packet_error():
+        raise RconPacketError("desync")
+
+    with pytest.raises(RconPacketError):
+        client._with_retry(packet_error, reconnect=False)
+    assert sleeps == []
+
+    def timeout():
+        raise RconTimeoutError("slow")
+
+    with pytest.raises(RconTimeoutError):
+        client._with_retry(timeout, reconnect=False)
+    assert len(sleeps) == 3
+    assert all(client.retry_delay <= delay <= RconClient.MAX_RETRY_DELAY for delay in sleeps)
+
+
+def test_async_rcon_client_pipelines_commands():
+    codec = RconPacketCodec(RconClient.MAX_PACKET_SIZE, RconClient.MIN_PACKET_SIZE)
+
+    async def handle(reader, writer):
+        while True:
+            try:
+                header = await reader.readexactly(4)
+            except asyncio.IncompleteReadError:
+                break
+            packet = codec.decode(header + await reader.readexactly(int.from_bytes(header, "little")))
+            if packet.type == RconPacketTypes.AUTH:
+                reply_id = packet.id if packet.body == "secret" else -1
+                writer.write(codec.encode(reply_id, RconPacketTypes.AUTH_RESPONSE, ""))
+            else:
+                writer.write(codec.encode(packet.id, RconPacketTypes.RESPONSE_VALUE, f"re:{packet.body}"))
+            await writer.drain()
+        writer.close()
+
+    async def scenario():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncRconClient(port=port, password="secret") as first, \
+                    AsyncRconClient(port=port, password="secret") as second:
+                results = await asyncio.gather(
+                    first.execute_many(["ListPlayers", "saveworld"]),
+                    second.execute_command("Broadcast hi"),
+                )
+            with pytest.raises(RconAuthenticationError):
+                await AsyncRconClient(port=port, password="wrong").connect()
+        finally:
+            server.close()
+            await server.wait_closed()
+        return results
+
+    assert asyncio.run(scenario()) == [["re:ListPlayers", "re:saveworld"], "re:Broadcast hi"]
+
+
+def test_async_rcon_client_serialises_shared_connection():
+    codec = RconPacketCodec(RconClient.MAX_PACKET_SIZE, RconClient.MIN_PACKET_SIZE)
+
+    async def handle(reader, writer):
+        while True:
+            try:
+                header = await reader.readexactly(4)
+            except asyncio.IncompleteReadError:
+                break
+            packet = codec.decode(header + await reader.readexactly(int.from_bytes(header, "little")))
+            reply_type = (
+                RconPacketTypes.AUTH_RESPONSE if packet.type == RconPacketTypes.AUTH
+                else RconPacketTypes.RESPONSE_VALUE
+            )
+            writer.write(codec.encode(packet.id, reply_type, f"re:{packet.body}"))
+            await writer.drain()
+        writer.close()
+
+    async def scenario():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            client = AsyncRconClient(port=port, password="secret")
+            results = await asyncio.gather(*(client.execute_command(f"cmd{i}") for i in range(5)))
+
+            async def broken_read():
+                raise RuntimeError("unexpected")
+
+            client._read_packet = broken_read
+            with pytest.raises(RuntimeError):
+                await client.execute_command("saveworld")
+            assert client.is_connected() is False
+        finally:
+            server.close()
+            await server.wait_closed()
+        return results
+
+    assert asyncio.run(scenario()) == [f"re:cmd{i}" for i in range(5)]
+
+
+def test_rcon_execute_command_reconnects_after_packet_error(monkeypatch):
+    import socket as socket_module
+    import threading
+
+    codec = RconPacketCodec(4096, 12)
+    listener = socket_module.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+    accepted = []
+
+    def read_packet(conn):
+        size = int.from_bytes(conn.recv(4, socket_module.MSG_WAITALL), "little")
+        return codec.decode(size.to_bytes(4, "little") + conn.recv(size, socket_module.MSG_WAITALL))
+
+    def serve():
+        for attempt in range(2):
+            conn, _ = listener.accept()
+            accepted.append(conn)
+            auth = read_packet(conn)
+            conn.sendall(codec.encode(auth.id, RconPacketTypes.AUTH_RESPONSE, ""))
+            command = read_packet(conn)
+            if attempt == 0:
+                # Declared size below the protocol minimum.
+                conn.sendall((4).to_bytes(4, "little") + b"\0" * 4)
+            else:
+                conn.sendall(codec.encode(command.id, RconPacketTypes.RESPONSE_VALUE, "ok"))
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    client = RconClient(server_ip='127.0.0.1', port=port, password='secret', retry_count=1, read_timeout=5.0)
+    try:
+        assert client.execute_command("saveworld") == "ok"
+    finally:
+        client.close()
+        server.join(timeout=5)
+        for conn in accepted:
+            conn.close()
+        listener.close()
+
+    assert len(accepted) == 2
+    assert sleeps == []
+
+
+def test_rcon_execute_command_caches_idempotent_queries(monkeypatch):
+    client = RconClient(port=27020, password="secret", cache_ttl=2.0)
+    client._connected = client._authenticated = True
+    sent = []
+
+    def fake_send_packet(self, data, packet_type):
+        sent.append(data)
+        return RconPacket(10, 1, RconPacketTypes.RESPONSE_VALUE, f"#{len(sent)}")
+
+    client._send_packet = MethodType(fake_send_packet, client)
+    now = [100.0]
+    monkeypatch.setattr(rcon_module.time, "monotonic", lambda: now[0])
+
+    assert client.execute_command("ListPlayers") == "#1"
+    assert client.execute_command("listplayers ") == "#1"
+    assert client.execute_command("saveworld") == "#2"
+    assert client.execute_command("saveworld") == "#3"
+    assert client.execute_command("getchat") == "#4"
+    assert client.execute_command("getchat") == "#5"
+    assert client.execute_command("listplayersfoo") == "#6"
+    now[0] += 2.5
+    assert client.execute_command("ListPlayers") == "#7"
+    assert sent == ["ListPlayers", "saveworld", "saveworld", "getchat", "getchat", "listplayersfoo", "ListPlayers"]
+
+
+def test_rcon_send_packet_writes_vectored_segments():
+    import socket as socket_module
+
+    codec = RconPacketCodec(RconClient.MAX_PACKET_SIZE, RconClient.MIN_PACKET_SIZE)
+    client = RconClient(port=27020, password="secret")
+    client.socket, server = socket_module.socketpair()
+    client._connected = True
+    try:
+        server.sendall(codec.encode(1, RconPacketTypes.RESPONSE_VALUE, "done"))
+        assert client._send_packet("saveworld", RconPacketTypes.EXEC_COMMAND).body == "done"
+        expected = codec.encode(1, RconPacketTypes.EXEC_COMMAND, "saveworld")
+        assert server.recv(len(expected) + 1) == expected
+    finally:
+        client.close()
+        server.close()
+
+
+def test_rcon_resolve_address_caches_hits_and_failures(monkeypatch):
+    import socket as socket_module
+
+    calls = []
+
+    def fake_getaddrinfo(host, port, type=0):
+        calls.append(host)
+        if host == "missing.example":
+            raise socket_module.gaierror(-2, "Name or service not known")
+        return [(socket_module.AF_INET6, socket_module.SOCK_STREAM, 6, "", ("::1", port, 0, 0))]
+
+    now = [1000.0]
+    monkeypatch.setattr(rcon_module.socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(rcon_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rcon_module, "_ADDR_CACHE", {})
+
+    expected = [(socket_module.AF_INET6, socket_module.SOCK_STREAM, 6, ("::1", 27020, 0, 0))]
+    assert rcon_module._resolve_address("ark.example", 27020) == expected
+    assert rcon_module._resolve_address("ark.example", 27020) == expected
+    for _ in range(2):
+        with pytest.raises(socket_module.gaierror):
+            rcon_module._resolve_address("missing.example", 27020)
+    assert calls == ["ark.example", "missing.example"]
+
+    now[0] += rcon_module.ADDR_NEGATIVE_CACHE_TTL + 1
+    with pytest.raises(socket_module.gaierror):
+        rcon_module._resolve_address("missing.example", 27020)
+    now[0] += rcon_module.ADDR_CACHE_TTL
+    rcon_module._resolve_address("ark.example", 27020)
+    assert calls == ["ark.example", "missing.example", "missing.example", "ark.example"]
+
+
+def test_clear_rcon_cache_forgets_settings_and_addresses(monkeypatch):
+    monkeypatch.setattr(rcon_module, "_ADDR_CACHE", {("ark.example", 27020): (float("inf"), [])})
+    rcon_module._cached_setting("RCONPort", "TheIsland_WP?RCONPort=27020", "/missing.ini", None)
+    assert rcon_module._cached_setting.cache_info().currsize >= 1
+
+    rcon_module.clear_rcon_cache()
+
+    assert rcon_module._cached_setting.cache_info().currsize == 0
+    assert rcon_module._ADDR_CACHE == {}
 
-    monkeypatch.setattr("asa_ctrl.core.rcon.RconClient", DummyClient)
-    assert execute_rcon_command("listplayers") == "ok"
-    assert responses == ["listplayers"]
 
 
 def test_cli_main_no_args_shows_help(capsys):
@@ -662,6 +1144,14 @@ def test_ini_config_helper_missing_file_returns_none(tmp_path):
     assert IniConfigHelper.parse_ini(str(missing)) is None
 
 
+def test_ini_config_helper_ini_mtime(tmp_path):
+    from asa_ctrl.common.config import IniConfigHelper
+    ini_path = tmp_path / "GameUserSettings.ini"
+    assert IniConfigHelper.ini_mtime(str(ini_path)) is None
+    ini_path.write_text("[ServerSettings]\n", encoding="utf-8")
+    assert IniConfigHelper.ini_mtime(str(ini_path)) == ini_path.stat().st_mtime_ns
+
+
 def main():  # pragma: no cover - simple runner
     print("Running asa_ctrl tests...\n")
     try:
@@ -11,6 +11,7 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from asa_ctrl.common.errors import RconConnectionError  # noqa: E402
 import asa_ctrl.core.restart_scheduler as scheduler  # noqa: E402
 from asa_ctrl.core.restart_scheduler import (
     CronSchedule,
@@ -62,6 +63,53 @@ def test_cron_schedule_accepts_seven_as_sunday():
     assert schedule.next_run(make_dt("2024-03-09 23:59")) == make_dt("2024-03-10 00:00")
 
 
+def test_cron_schedule_skips_to_allowed_month_and_year():
+    schedule = CronSchedule("30 2 29 2 *")
+    assert schedule.next_run(make_dt("2023-03-01 00:00")) == make_dt("2024-02-29 02:30")
+    schedule = CronSchedule("0 0 1 jan *")
+    assert schedule.next_run(make_dt("2024-12-31 23:59")) == make_dt("2025-01-01 00:00")
+
+
+def test_cron_schedule_unreachable_within_a_year():
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 30 2 *").next_run(make_dt("2024-01-01 00:00"))
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 29 2 *").next_run(make_dt("2024-03-01 00:00"))
+
+
+def test_cron_schedule_matches_brute_force_scan():
+    def brute_force(schedule, reference):
+        current = reference + timedelta(minutes=1)
+        while not schedule._matches(current):
+            current += timedelta(minutes=1)
+        return current
+
+    reference = make_dt("2024-02-27 22:47")
+    for expression in ("*/7 */5 * * *", "15 23 * * sun", "0 0 1,15 * 5", "5-10 3 * mar-apr *"):
+        schedule = CronSchedule(expression)
+        assert schedule.next_run(reference) == brute_force(schedule, reference)
+
+
+def test_build_events_skips_elapsed_warnings():
+    next_run = make_dt("2024-01-01 04:00")
+    events = scheduler._build_events(next_run, [30, 5, 1], make_dt("2024-01-01 03:40"))
+    assert events == [
+        ("warn", make_dt("2024-01-01 03:55"), 5),
+        ("warn", make_dt("2024-01-01 03:59"), 1),
+        ("restart", next_run, None),
+    ]
+
+
+def test_cron_schedule_shares_compiled_fields_per_expression():
+    first = CronSchedule("*/15 8-9 * * mon-fri")
+    second = CronSchedule("  */15  8-9 * *   mon-fri ")
+    assert first._fields is second._fields
+    assert all(values is None or isinstance(values, bytes) for values in first._fields)
+    with pytest.raises(ValueError):
+        CronSchedule("not a cron")
+    assert first.next_run(make_dt("2024-06-03 08:00")) == second.next_run(make_dt("2024-06-03 08:00"))
+
+
 def test_parse_warning_offsets_default_and_custom():
     assert parse_warning_offsets("") == [30, 5, 1]
     assert parse_warning_offsets("15, 5 ,1") == [15, 5, 1]
@@ -85,6 +133,22 @@ def test_read_pid_from_file_invalid(tmp_path):
     assert _read_pid_from_file(str(pid_path)) is None
 
 
+def test_read_pid_from_file_rereads_only_when_file_changes(tmp_path, monkeypatch):
+    pid_path = tmp_path / "server.pid"
+    pid_path.write_text("1234\n", encoding="utf-8")
+    assert _read_pid_from_file(str(pid_path)) == 1234
+
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda *args, **kwargs: opened.append(args[0]) or real_open(*args, **kwargs))
+    assert _read_pid_from_file(str(pid_path)) == 1234
+    assert opened == []
+
+    pid_path.write_text("56789\n", encoding="utf-8")
+    assert _read_pid_from_file(str(pid_path)) == 56789
+    assert opened == [str(pid_path)]
+
+
 def test_is_process_alive_false(monkeypatch):
     def fake_kill(_pid, _sig):
         raise OSError("nope")
@@ -95,24 +159,57 @@ def test_is_process_alive_false(monkeypatch):
 
 def test_trigger_restart_missing_pid_file(caplog):
     with caplog.at_level("ERROR"):
-        _trigger_restart(None, scheduler.get_logger(__name__))
+        assert _trigger_restart(None, scheduler.get_logger(__name__)) is False
     assert "Cannot trigger restart" in "\n".join(caplog.messages)
 
 
 def test_announce_helpers(monkeypatch):
     calls = []
 
-    def fake_run(command, _logger, _settings):
+    def fake_run(command, _logger, _settings, client=None):
         calls.append(command)
         return True
 
     monkeypatch.setattr(scheduler, "_run_rcon_command", fake_run)
     settings = scheduler.AsaSettings({})
-    now = datetime(2024, 1, 1, 12, 0)
-    _announce(5, now, scheduler.get_logger(__name__), settings)
-    _announce_now(now, scheduler.get_logger(__name__), settings)
-    assert any("restart in 5 minutes" in command for command in calls)
-    assert any("restarting now" in command for command in calls)
+    _announce(5, "12:00", scheduler.get_logger(__name__), settings)
+    _announce_now("12:00", scheduler.get_logger(__name__), settings)
+    assert any("restart in 5 minutes (scheduled 12:00)" in command for command in calls)
+    assert any("restarting now (scheduled 12:00)" in command for command in calls)
+
+
+def test_run_rcon_command_executes_in_process(monkeypatch, caplog):
+    calls = []
+
+    def fake_execute(command, server_ip="127.0.0.1", settings=None):
+        calls.append((command, settings))
+        if command == "fail":
+            raise scheduler.AsaCtrlError("connection refused")
+        return "ok"
+
+    monkeypatch.setattr(scheduler, "execute_rcon_command", fake_execute)
+    settings = scheduler.AsaSettings({})
+    logger = scheduler.get_logger(__name__)
+    assert scheduler._run_rcon_command("serverchat hi", logger, settings) is True
+    with caplog.at_level("WARNING"):
+        assert scheduler._run_rcon_command("fail", logger, settings) is False
+    assert calls == [("serverchat hi", settings), ("fail", settings)]
+    assert "connection refused" in "\n".join(caplog.messages)
+
+
+def test_run_rcon_command_leaves_retries_to_shared_client():
+    class FakeClient:
+        def __init__(self):
+            self.commands = []
+
+        def execute_command(self, command):
+            self.commands.append(command)
+            raise RconConnectionError("connection reset")
+
+    client = FakeClient()
+    settings = scheduler.AsaSettings({})
+    assert not scheduler._run_rcon_command("serverchat hi", scheduler.get_logger(__name__), settings, client=client)
+    assert client.commands == ["serverchat hi"]
 
 
 def test_run_scheduler_no_cron_exits_quickly(monkeypatch):
@@ -143,12 +240,15 @@ def test_run_scheduler_announces_and_triggers(monkeypatch):
         def advance(cls, seconds: float) -> None:
             cls.current = cls.current + timedelta(seconds=seconds)
 
+    sleeps = []
+
     def fast_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
         FakeDateTime.advance(seconds)
 
     calls = []
 
-    def fake_run_rcon(command: str, _logger, _settings) -> bool:
+    def fake_run_rcon(command: str, _logger, _settings, client=None) -> bool:
         calls.append(command)
         return True
 
@@ -173,3 +273,81 @@ def test_run_scheduler_announces_and_triggers(monkeypatch):
     # Expect warning and final announcement
     assert any("restart in 1 minute" in message for message in calls)
     assert any("restarting now" in message for message in calls)
+    # The warning is due immediately; the restart is reached in one sleep (no 30 s polling)
+    assert sleeps == [60.0]
+
+
+def test_run_scheduler_reads_server_pid_once_per_window(monkeypatch):
+    base_time = datetime(2024, 1, 1, 12, 0)
+
+    class FakeDateTime(datetime):
+        current = base_time
+
+        @classmethod
+        def now(cls):
+            return cls.current
+
+    def fast_sleep(seconds: float) -> None:
+        FakeDateTime.current = FakeDateTime.current + timedelta(seconds=seconds)
+
+    reads = []
+
+    def fake_read(path):
+        reads.append(path)
+        return 4242
+
+    def fake_trigger(_path, _logger):
+        raise RuntimeError("stop")
+
+    monkeypatch.setenv("SERVER_RESTART_CRON", "0 13 * * *")
+    monkeypatch.setenv("SERVER_RESTART_WARNINGS", "30,5,1")
+    monkeypatch.setenv("ASA_SERVER_PID_FILE", "/tmp/server.pid")
+    monkeypatch.setattr(scheduler, "datetime", FakeDateTime)
+    monkeypatch.setattr(scheduler.time, "sleep", fast_sleep)
+    monkeypatch.setattr(scheduler, "_read_pid_from_file", fake_read)
+    monkeypatch.setattr(scheduler, "_is_process_alive", lambda pid: pid == 4242)
+    monkeypatch.setattr(scheduler, "_run_rcon_command", lambda *args, **kwargs: True)
+    monkeypatch.setattr(scheduler, "_trigger_restart", fake_trigger)
+
+    with pytest.raises(RuntimeError):
+        run_scheduler()
+
+    assert reads == ["/tmp/server.pid"]
+
+
+def test_run_scheduler_skips_post_restart_delay_after_successful_trigger(monkeypatch):
+    base_time = datetime(2024, 1, 1, 12, 0)
+
+    class FakeDateTime(datetime):
+        current = base_time
+
+        @classmethod
+        def now(cls):
+            return cls.current
+
+    sleeps = []
+
+    def fast_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        FakeDateTime.current = FakeDateTime.current + timedelta(seconds=seconds)
+
+    outcomes = iter([True, False])
+
+    def fake_trigger(_path, _logger):
+        try:
+            return next(outcomes)
+        except StopIteration:
+            raise RuntimeError("stop")
+
+    monkeypatch.setenv("SERVER_RESTART_CRON", "* * * * *")
+    monkeypatch.setenv("SERVER_RESTART_WARNINGS", "1")
+    monkeypatch.setattr(scheduler, "datetime", FakeDateTime)
+    monkeypatch.setattr(scheduler.time, "sleep", fast_sleep)
+    monkeypatch.setattr(scheduler, "_run_rcon_command", lambda *args, **kwargs: True)
+    monkeypatch.setattr(scheduler, "_trigger_restart", fake_trigger)
+
+    with pytest.raises(RuntimeError):
+        run_scheduler()
+
+    # Successful trigger: straight to the next window. Failed trigger: back off.
+    assert sleeps == [60.0, 60.0, scheduler.POST_RESTART_DELAY_SECONDS, 50.0]
@@ -3,16 +3,24 @@ from __future__ import annotations
 import logging
 import os
 import signal
+import subprocess
+import sys
 import tarfile
+import threading
+import time
+import zipfile
 from unittest.mock import Mock
 
 import pytest
 
 from server_runtime import bootstrap as runtime_bootstrap
+from server_runtime import log_streamer as runtime_log_streamer
 from server_runtime import logging_utils as runtime_logging
 from server_runtime import params as runtime_params
 from server_runtime import permissions as runtime_permissions
+from server_runtime import plugins as runtime_plugins
 from server_runtime import proton as runtime_proton
+from server_runtime import shutdown as runtime_shutdown
 from server_runtime import steamcmd as runtime_steamcmd
 from server_runtime.archive_utils import safe_extract_tar
 from server_runtime.constants import RuntimeSettings
@@ -52,6 +60,28 @@ def test_server_admin_password_default_payload_when_empty(monkeypatch):
     assert "ServerAdminPassword=changeme" in params
 
 
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"[ServerSettings]\r\n  ServerAdminPassword = secret\r\n", True),
+        (b"[ServerSettings]\nServerPassword=abc\n;ServerAdminPassword=x", False),
+        (b"", False),
+    ],
+)
+def test_server_admin_password_in_ini(monkeypatch, tmp_path, content, expected):
+    ini_path = tmp_path / "GameUserSettings.ini"
+    ini_path.write_bytes(content)
+    monkeypatch.setattr(runtime_params, "GAME_USER_SETTINGS_PATH", str(ini_path))
+
+    assert runtime_params.server_admin_password_in_ini() is expected
+
+
+def test_server_admin_password_in_ini_missing_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(runtime_params, "GAME_USER_SETTINGS_PATH", str(tmp_path / "missing.ini"))
+
+    assert runtime_params.server_admin_password_in_ini() is False
+
+
 def test_ensure_nosteam_flag_idempotent(monkeypatch):
     monkeypatch.setenv("ASA_START_PARAMS", "Map?listen -flag")
     first = runtime_params.ensure_nosteam_flag(os.environ["ASA_START_PARAMS"])
@@ -65,6 +95,7 @@ def test_ensure_nosteam_flag_idempotent(monkeypatch):
 def test_inject_mods_param(monkeypatch):
     logger = logging.getLogger("test")
     result = Mock(returncode=0, stdout="-mods=1,2", stderr="")
+    monkeypatch.setattr(runtime_params, "_read_mods_string", lambda logger: None)
     monkeypatch.setattr(runtime_params.subprocess, "run", lambda *args, **kwargs: result)
 
     merged = runtime_params.inject_mods_param("Map?listen", logger)
@@ -74,12 +105,39 @@ def test_inject_mods_param(monkeypatch):
 def test_inject_mods_param_empty(monkeypatch):
     logger = logging.getLogger("test")
     result = Mock(returncode=0, stdout="", stderr="")
+    monkeypatch.setattr(runtime_params, "_read_mods_string", lambda logger: None)
     monkeypatch.setattr(runtime_params.subprocess, "run", lambda *args, **kwargs: result)
 
     merged = runtime_params.inject_mods_param("Map?listen", logger)
     assert merged == "Map?listen"
 
 
+def test_inject_mods_param_reads_database_in_process(monkeypatch, tmp_path):
+    database = tmp_path / "mods.json"
+    database.write_text('[{"mod_id": 7, "enabled": true}, {"mod_id": 8}]', encoding="utf-8")
+    monkeypatch.setenv("ASA_MOD_DATABASE_PATH", str(database))
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("asa-ctrl should not be spawned")
+
+    monkeypatch.setattr(runtime_params.subprocess, "run", fail)
+
+    merged = runtime_params.inject_mods_param("Map?listen", logging.getLogger("test"))
+
+    assert merged == "Map?listen -mods=7"
+
+
+def test_inject_mods_param_skips_undecodable_database(monkeypatch, tmp_path):
+    database = tmp_path / "mods.json"
+    database.write_bytes(b'\xff\xfe[{"mod_id": 7}]')
+    monkeypatch.setenv("ASA_MOD_DATABASE_PATH", str(database))
+    monkeypatch.delenv("ASA_START_PARAMS", raising=False)
+
+    merged = runtime_params.inject_mods_param("Map?listen", logging.getLogger("test"))
+
+    assert merged == "Map?listen"
+
+
 def test_resolve_proton_version_detected_latest(monkeypatch):
     monkeypatch.delenv("PROTON_VERSION", raising=False)
     monkeypatch.setattr(
@@ -95,6 +153,100 @@ def test_resolve_proton_version_detected_latest(monkeypatch):
     assert os.environ["PROTON_VERSION"] == "9-20"
 
 
+def test_find_latest_release_with_assets_prefers_newest_available(monkeypatch):
+    releases = [{"tag_name": f"GE-Proton9-{n}"} for n in (22, 21, 20, 19)]
+    monkeypatch.setattr(runtime_proton, "_fetch_json", lambda url: releases if "page=1" in url else None)
+    available = {"9-20", "9-19"}
+    monkeypatch.setattr(runtime_proton, "_check_release_assets", lambda version: version in available)
+
+    assert runtime_proton.find_latest_release_with_assets(skip_version="9-22") == "9-20"
+
+
+def test_http_request_reuses_keep_alive_connection(monkeypatch):
+    created = []
+
+    class FakeResponse:
+        status = 302
+        will_close = False
+
+        @staticmethod
+        def read():
+            return b""
+
+    class FakeConnection:
+        def __init__(self, host, timeout):
+            self.host = host
+            self.requests = []
+            self.closed = False
+            created.append(self)
+
+        def request(self, method, target, headers):
+            if self.closed:
+                raise ConnectionResetError("stale")
+            self.requests.append((method, target))
+
+        def getresponse(self):
+            return FakeResponse()
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(runtime_proton.http.client, "HTTPSConnection", FakeConnection)
+    monkeypatch.setattr(runtime_proton.urllib.request, "getproxies", lambda: {})
+    monkeypatch.setattr(runtime_proton, "_CONNECTIONS", {})
+
+    assert runtime_proton._asset_exists("https://github.com/a.tar.gz") is True
+    assert runtime_proton._asset_exists("https://github.com/a.sha512sum") is True
+    assert len(created) == 1
+    assert created[0].requests == [("HEAD", "/a.tar.gz"), ("HEAD", "/a.sha512sum")]
+
+    created[0].closed = True
+    assert runtime_proton._asset_exists("https://github.com/b.tar.gz?x=1") is True
+    assert len(created) == 2
+    assert created[1].requests == [("HEAD", "/b.tar.gz?x=1")]
+
+
+def test_http_request_tunnels_through_https_proxy(monkeypatch):
+    created = []
+
+    class FakeResponse:
+        status = 200
+        will_close = True
+
+        @staticmethod
+        def read():
+            return b"{}"
+
+    class FakeConnection:
+        def __init__(self, host, port=None, timeout=None):
+            self.address = (host, port)
+            self.tunnel = None
+            created.append(self)
+
+        def set_tunnel(self, host, headers=None):
+            self.tunnel = (host, headers)
+
+        def request(self, method, target, headers):
+            pass
+
+        def getresponse(self):
+            return FakeResponse()
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(runtime_proton.http.client, "HTTPSConnection", FakeConnection)
+    monkeypatch.setattr(
+        runtime_proton.urllib.request, "getproxies", lambda: {"https": "http://user:pw@proxy.local:3128"}
+    )
+    monkeypatch.setattr(runtime_proton.urllib.request, "proxy_bypass", lambda _host: False)
+    monkeypatch.setattr(runtime_proton, "_CONNECTIONS", {})
+
+    assert runtime_proton._fetch_json("https://api.github.com/repos/x/releases") == {}
+    assert created[0].address == ("proxy.local", 3128)
+    assert created[0].tunnel == ("api.github.com", {"Proxy-Authorization": "Basic dXNlcjpwdw=="})
+
+
 def test_resolve_proton_version_fallback(monkeypatch):
     monkeypatch.delenv("PROTON_VERSION", raising=False)
     monkeypatch.setattr(runtime_proton, "_fetch_json", lambda _url: None)
@@ -117,6 +269,22 @@ def test_verify_sha512_ok(tmp_path):
     assert runtime_proton._verify_sha512(archive, checksum) is True
 
 
+def test_download_file_hashes_while_streaming(tmp_path):
+    import hashlib
+
+    source = tmp_path / "source.tar.gz"
+    source.write_bytes(b"proton" * 1000)
+    archive = tmp_path / "GE-ProtonX.tar.gz"
+    checksum = tmp_path / "GE-ProtonX.sha512sum"
+    checksum.write_text(f"{hashlib.sha512(source.read_bytes()).hexdigest()}  {archive.name}\n", encoding="utf-8")
+
+    digest = hashlib.sha512()
+    runtime_proton._download_file(source.as_uri(), archive, digest)
+    archive.unlink()
+
+    assert runtime_proton._verify_sha512(archive, checksum, digest) is True
+
+
 def test_scheduler_contract_exports_env(monkeypatch, tmp_path):
     monkeypatch.setenv("SERVER_RESTART_CRON", "0 4 * * *")
     monkeypatch.delenv("SERVER_RESTART_WARNINGS", raising=False)
@@ -138,13 +306,14 @@ def test_scheduler_contract_exports_env(monkeypatch, tmp_path):
         calls["command"] = command
         return DummyProcess()
 
-    monkeypatch.setattr(os.path, "isfile", lambda path: True)
-    monkeypatch.setattr(os, "access", lambda path, mode: True)
-    monkeypatch.setattr("server_runtime.supervisor.ASA_CTRL_BIN", "/usr/local/bin/asa-ctrl")
+    asa_ctrl = tmp_path / "asa-ctrl"
+    asa_ctrl.write_text("#!/bin/sh\n", encoding="utf-8")
+    asa_ctrl.chmod(0o755)
+    monkeypatch.setattr("server_runtime.supervisor.ASA_CTRL_BIN", str(asa_ctrl))
     monkeypatch.setattr("server_runtime.supervisor.subprocess.Popen", fake_popen)
     supervisor.start_restart_scheduler()
 
-    assert calls["command"] == ["/usr/local/bin/asa-ctrl", "restart-scheduler"]
+    assert calls["command"] == [str(asa_ctrl), "restart-scheduler"]
     assert os.environ["ASA_SUPERVISOR_PID_FILE"]
     assert os.environ["ASA_SERVER_PID_FILE"]
     assert os.environ["SERVER_RESTART_WARNINGS"] == "30,5,1"
@@ -160,6 +329,76 @@ def test_configure_runtime_logging_invalid_level_warns(monkeypatch, caplog):
     assert "Invalid ASA_LOG_LEVEL" in caplog.text
 
 
+def test_write_marker_is_owned_by_target_user(monkeypatch, tmp_path):
+    monkeypatch.setattr(runtime_permissions, "TARGET_UID", os.getuid())
+    monkeypatch.setattr(runtime_permissions, "TARGET_GID", os.getgid())
+    marker = tmp_path / ".permissions_set"
+
+    runtime_permissions._write_marker(marker)
+    runtime_permissions._write_marker(marker)
+
+    assert marker.stat().st_uid == os.getuid()
+
+
+def test_drop_privileges_writes_marker_only_after_recursive_pass(monkeypatch, tmp_path):
+    monkeypatch.setattr(runtime_permissions.os, "geteuid", lambda: 0, raising=False)
+    monkeypatch.delenv(runtime_permissions.PRIVS_DROPPED_ENV, raising=False)
+    monkeypatch.setattr(runtime_permissions, "TARGET_UID", os.getuid())
+    monkeypatch.setattr(runtime_permissions, "TARGET_GID", os.getgid())
+    monkeypatch.setattr(runtime_permissions, "STEAM_HOME_DIR", str(tmp_path / "steam"))
+    monkeypatch.setattr(runtime_permissions, "STEAMCMD_DIR", str(tmp_path / "steamcmd"))
+    monkeypatch.setattr(runtime_permissions, "SERVER_FILES_DIR", str(tmp_path / "server"))
+    monkeypatch.setattr(runtime_permissions, "CLUSTER_DIR", str(tmp_path / "cluster"))
+    (tmp_path / "cluster").mkdir()
+    (tmp_path / "cluster" / ".permissions_set").touch()
+    bulk_calls = []
+
+    def walk(path, recursive):
+        if recursive:
+            assert not (path / ".permissions_set").exists()
+            if path.name == "server":
+                raise PermissionError("interrupted")
+
+    monkeypatch.setattr(runtime_permissions, "_bulk_chown", lambda paths: bulk_calls.append(paths) or False)
+    monkeypatch.setattr(runtime_permissions, "_chown_if_possible", walk)
+    monkeypatch.setattr(runtime_permissions.shutil, "which", lambda _cmd: None)
+
+    with pytest.raises(RuntimeError, match="Neither runuser nor su"):
+        runtime_permissions.ensure_permissions_and_drop_privileges(logging.getLogger("test"))
+
+    assert [path.name for path in bulk_calls[0]] == ["steam", "steamcmd", "server"]
+    assert (tmp_path / "steam" / ".permissions_set").exists()
+    assert not (tmp_path / "server" / ".permissions_set").exists()
+
+
+def test_drop_privileges_falls_back_to_python_walk_when_chown_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr(runtime_permissions.os, "geteuid", lambda: 0, raising=False)
+    monkeypatch.delenv(runtime_permissions.PRIVS_DROPPED_ENV, raising=False)
+    monkeypatch.setattr(runtime_permissions, "TARGET_UID", os.getuid())
+    monkeypatch.setattr(runtime_permissions, "TARGET_GID", os.getgid())
+    monkeypatch.setattr(runtime_permissions, "STEAM_HOME_DIR", str(tmp_path / "steam"))
+    monkeypatch.setattr(runtime_permissions, "STEAMCMD_DIR", str(tmp_path / "steamcmd"))
+    monkeypatch.setattr(runtime_permissions, "SERVER_FILES_DIR", str(tmp_path / "server"))
+    monkeypatch.setattr(runtime_permissions, "CLUSTER_DIR", str(tmp_path / "cluster"))
+    bulk_calls = []
+    walked = []
+    monkeypatch.setattr(runtime_permissions, "_bulk_chown", lambda paths: bulk_calls.append(paths) or False)
+    monkeypatch.setattr(
+        runtime_permissions,
+        "_chown_if_possible",
+        lambda path, recursive: walked.append(path.name) if recursive else None,
+    )
+    monkeypatch.setattr(runtime_permissions.shutil, "which", lambda _cmd: None)
+
+    with pytest.raises(RuntimeError, match="Neither runuser nor su"):
+        runtime_permissions.ensure_permissions_and_drop_privileges(logging.getLogger("test"))
+
+    assert len(bulk_calls) == 1
+    assert [path.name for path in bulk_calls[0]] == ["steam", "steamcmd", "server", "cluster"]
+    assert walked == ["steam", "steamcmd", "server", "cluster"]
+    assert (tmp_path / "server" / ".permissions_set").exists()
+
+
 def test_drop_privileges_reports_exec_errors(monkeypatch, tmp_path):
     monkeypatch.setattr(runtime_permissions.os, "geteuid", lambda: 0, raising=False)
     monkeypatch.delenv(runtime_permissions.PRIVS_DROPPED_ENV, raising=False)
@@ -168,6 +407,7 @@ def test_drop_privileges_reports_exec_errors(monkeypatch, tmp_path):
     monkeypatch.setattr(runtime_permissions, "SERVER_FILES_DIR", str(tmp_path / "server"))
     monkeypatch.setattr(runtime_permissions, "CLUSTER_DIR", str(tmp_path / "cluster"))
     monkeypatch.setattr(runtime_permissions, "_chown_if_possible", lambda _path, recursive: None)
+    monkeypatch.setattr(runtime_permissions, "_bulk_chown", lambda _paths: True)
     monkeypatch.setattr(runtime_permissions.shutil, "which", lambda cmd: "/usr/sbin/runuser" if cmd == "runuser" else None)
     monkeypatch.setattr(
         runtime_permissions.os,
@@ -179,6 +419,16 @@ def test_drop_privileges_reports_exec_errors(monkeypatch, tmp_path):
         runtime_permissions.ensure_permissions_and_drop_privileges(logging.getLogger("test"))
 
 
+def test_stop_server_process_returns_once_child_exits():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    started = time.monotonic()
+
+    runtime_shutdown.stop_server_process(process, 30, logging.getLogger("test-stop"))
+
+    assert process.poll() is not None
+    assert time.monotonic() - started < 5
+
+
 def test_shutdown_sequence_skips_delay_when_saveworld_fails(monkeypatch):
     logger = logging.getLogger("test-shutdown")
     settings = RuntimeSettings.from_env()
@@ -203,6 +453,30 @@ def test_shutdown_sequence_skips_delay_when_saveworld_fails(monkeypatch):
     assert sleep_calls == []
 
 
+@pytest.mark.parametrize(
+    ("mode", "message"),
+    [(None, "is not a regular file"), (0o644, "is not executable")],
+)
+def test_start_restart_scheduler_rejects_unusable_binary(monkeypatch, tmp_path, caplog, mode, message):
+    monkeypatch.setenv("SERVER_RESTART_CRON", "0 4 * * *")
+    asa_ctrl = tmp_path / "asa-ctrl"
+    if mode is not None:
+        asa_ctrl.write_text("#!/bin/sh\n", encoding="utf-8")
+        asa_ctrl.chmod(mode)
+    monkeypatch.setattr("server_runtime.supervisor.ASA_CTRL_BIN", str(asa_ctrl))
+    monkeypatch.setattr(
+        "server_runtime.supervisor.subprocess.Popen",
+        lambda *_args, **_kwargs: pytest.fail("scheduler must not be started"),
+    )
+    supervisor = ServerSupervisor(RuntimeSettings.from_env(), logging.getLogger("test-scheduler-bin"))
+    caplog.set_level(logging.WARNING)
+
+    supervisor.start_restart_scheduler()
+
+    assert supervisor.restart_scheduler_process is None
+    assert message in caplog.text
+
+
 def test_supervisor_run_restarts_after_launch_exception(monkeypatch, caplog):
     logger = logging.getLogger("test-supervisor")
     settings = RuntimeSettings.from_env()
@@ -217,7 +491,7 @@ def test_supervisor_run_restarts_after_launch_exception(monkeypatch, caplog):
         return 0
 
     monkeypatch.setattr(supervisor, "_launch_server_once", fake_launch)
-    monkeypatch.setattr("server_runtime.supervisor.time.sleep", lambda _seconds: None)
+    monkeypatch.setattr(supervisor, "_sleep_interruptibly", lambda _seconds: None)
     caplog.set_level(logging.ERROR)
 
     code = supervisor.run()
@@ -262,6 +536,121 @@ def test_configure_runtime_logging_warn_alias(monkeypatch):
     logger.warning.assert_not_called()
 
 
+def test_wait_for_server_returns_exit_code():
+    supervisor = ServerSupervisor(RuntimeSettings.from_env(), logging.getLogger("test-wait"))
+    supervisor.server_process = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+
+    assert supervisor._wait_for_server() == 3
+
+
+def test_log_streamer_follows_appends_and_replacement(tmp_path):
+    log_file = tmp_path / "ShooterGame.log"
+    log_file.write_bytes(b"old line\n")
+    output = tmp_path / "stdout.txt"
+    out_fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    streamer = runtime_log_streamer.LogStreamer(str(log_file), output_fd=out_fd, poll_interval=0.05)
+
+    def wait_for(expected):
+        deadline = time.monotonic() + 5
+        while output.read_bytes() != expected and time.monotonic() < deadline:
+            time.sleep(0.02)
+        return output.read_bytes()
+
+    try:
+        streamer.start()
+        with log_file.open("ab") as handle:
+            handle.write(b"first\n")
+        assert wait_for(b"first\n") == b"first\n"
+
+        replacement = tmp_path / "ShooterGame.log.new"
+        replacement.write_bytes(b"second\n")
+        os.replace(replacement, log_file)
+        assert wait_for(b"first\nsecond\n") == b"first\nsecond\n"
+    finally:
+        streamer.stop()
+        os.close(out_fd)
+
+    assert not streamer.is_alive()
+
+
+def test_log_streamer_stop_leaves_fds_open_while_thread_runs(tmp_path, monkeypatch):
+    log_file = tmp_path / "ShooterGame.log"
+    log_file.write_bytes(b"")
+    streamer = runtime_log_streamer.LogStreamer(str(log_file), output_fd=os.open(os.devnull, os.O_WRONLY))
+    release = threading.Event()
+    monkeypatch.setattr(streamer, "_follow", release.wait)
+    streamer.start()
+    stop_r = streamer._stop_r
+
+    monkeypatch.setattr(streamer._thread, "join", lambda timeout=None: None)
+    streamer.stop()
+    assert streamer.is_alive()
+    os.fstat(stop_r)  # still open
+
+    release.set()
+    thread = streamer._thread
+    threading.Thread.join(thread, timeout=5)
+    streamer.stop()
+    os.close(streamer.output_fd)
+    assert not streamer.is_alive()
+    assert streamer._stop_r is None
+
+
+def test_supervisor_run_dispatches_sigterm_from_wakeup_fd(monkeypatch):
+    supervisor = ServerSupervisor(RuntimeSettings.from_env(), logging.getLogger("test-signals"))
+    monkeypatch.setattr("server_runtime.supervisor.send_saveworld", lambda _logger: False)
+    monkeypatch.setattr("server_runtime.supervisor.Path.unlink", lambda *_args, **_kwargs: None)
+    previous_handler = signal.getsignal(signal.SIGTERM)
+
+    def fake_launch():
+        supervisor.server_process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        os.kill(os.getpid(), signal.SIGTERM)
+        return supervisor._wait_for_server()
+
+    monkeypatch.setattr(supervisor, "_launch_server_once", fake_launch)
+
+    code = supervisor.run()
+
+    assert code == -signal.SIGTERM
+    assert supervisor.supervisor_exit_requested is True
+    assert signal.getsignal(signal.SIGTERM) is previous_handler
+
+
+def test_supervisor_pid_file_written_and_removed(tmp_path):
+    supervisor = ServerSupervisor(RuntimeSettings.from_env(), logging.getLogger("test-pid"))
+    supervisor._supervisor_pid_path = tmp_path / "supervisor.pid"
+    supervisor._pid_path = tmp_path / "server.pid"
+    supervisor._supervisor_pid_path.write_text("stale-longer-content\n", encoding="utf-8")
+
+    supervisor.register_supervisor_pid()
+    assert supervisor._supervisor_pid_path.read_text(encoding="utf-8") == f"{os.getpid()}\n"
+
+    supervisor.cleanup()
+    assert not supervisor._supervisor_pid_path.exists()
+
+
+def test_supervisor_restart_delay_ends_on_sigterm(monkeypatch):
+    settings = RuntimeSettings.from_env()
+    settings.server_restart_delay = 30
+    supervisor = ServerSupervisor(settings, logging.getLogger("test-restart-delay"))
+    monkeypatch.setattr("server_runtime.supervisor.Path.unlink", lambda *_args, **_kwargs: None)
+    attempts = []
+
+    def fake_launch():
+        attempts.append(1)
+        threading.Timer(0.1, os.kill, (os.getpid(), signal.SIGTERM)).start()
+        return 1
+
+    monkeypatch.setattr(supervisor, "_launch_server_once", fake_launch)
+    started = time.monotonic()
+
+    code = supervisor.run()
+
+    assert code == 1
+    assert attempts == [1]
+    assert time.monotonic() - started < 5
+
+
 def test_cleanup_after_run_terminates_server_process(monkeypatch):
     logger = logging.getLogger("test-cleanup")
     settings = RuntimeSettings.from_env()
@@ -284,6 +673,9 @@ def test_safe_extract_tar_allows_symlink_targets_within_destination(tmp_path):
             self._members = members
             self.extract_calls = []
 
+        def __iter__(self):
+            return iter(self._members)
+
         def getmembers(self):
             return self._members
 
@@ -313,6 +705,53 @@ def test_safe_extract_tar_rejects_hardlink_targets_outside_destination(tmp_path)
             safe_extract_tar(tar, tmp_path / "extract")
 
 
+def test_safe_extract_tar_rejects_member_paths_outside_destination(tmp_path):
+    for name in ("../escape.txt", "nested/../../escape.txt", "/abs/escape.txt"):
+        archive = tmp_path / "archive-traversal.tar"
+        with tarfile.open(archive, "w") as tar:
+            tar.addfile(tarfile.TarInfo(name))
+
+        with tarfile.open(archive, "r") as tar:
+            with pytest.raises(RuntimeError, match="Unsafe tar member path detected"):
+                safe_extract_tar(tar, tmp_path / "extract")
+
+
+def test_safe_extract_tar_rejects_escape_through_existing_symlink(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    dest = tmp_path / "extract"
+    dest.mkdir()
+    (dest / "pfx").symlink_to(outside)
+    archive = tmp_path / "archive-symlink-escape.tar"
+    with tarfile.open(archive, "w") as tar:
+        tar.addfile(tarfile.TarInfo("pfx/evil"))
+
+    with tarfile.open(archive, "r") as tar:
+        with pytest.raises(RuntimeError, match="Unsafe tar member path detected"):
+            safe_extract_tar(tar, dest)
+    assert not (outside / "evil").exists()
+
+
+def test_safe_extract_tar_stops_at_first_unsafe_member(tmp_path):
+    class CountingTar:
+        def __init__(self, members):
+            self._members = members
+            self.read = 0
+
+        def __iter__(self):
+            for member in self._members:
+                self.read += 1
+                yield member
+
+        def getmembers(self):  # pragma: no cover - never reached
+            raise AssertionError("extraction must not start")
+
+    archive = CountingTar([tarfile.TarInfo("ok.txt"), tarfile.TarInfo("../bad"), tarfile.TarInfo("later")])
+    with pytest.raises(RuntimeError, match="Unsafe tar member path detected"):
+        safe_extract_tar(archive, tmp_path / "extract")
+    assert archive.read == 2
+
+
 def test_prepare_runtime_env_falls_back_when_xdg_runtime_dir_is_file(monkeypatch, tmp_path):
     logger = logging.getLogger("test-runtime-env")
     supervisor = ServerSupervisor(RuntimeSettings.from_env(), logger)
@@ -387,6 +826,7 @@ def test_inject_mods_param_ignores_nonzero_exit(monkeypatch):
     logger = logging.getLogger("test")
     monkeypatch.setenv("ASA_START_PARAMS", "Map?listen")
     result = Mock(returncode=1, stdout="-mods=1,2", stderr="error")
+    monkeypatch.setattr(runtime_params, "_read_mods_string", lambda logger: None)
     monkeypatch.setattr(runtime_params.subprocess, "run", lambda *args, **kwargs: result)
 
     merged = runtime_params.inject_mods_param("Map?listen", logger)
@@ -407,7 +847,7 @@ def test_verify_sha512_requires_exact_filename_match(tmp_path):
     assert runtime_proton._verify_sha512(archive, checksum) is False
 
 
-def test_scheduler_contract_defaults_warnings_when_empty(monkeypatch):
+def test_scheduler_contract_defaults_warnings_when_empty(monkeypatch, tmp_path):
     monkeypatch.setenv("SERVER_RESTART_CRON", "0 4 * * *")
     monkeypatch.setenv("SERVER_RESTART_WARNINGS", "")
     logger = logging.getLogger("test")
@@ -421,9 +861,10 @@ def test_scheduler_contract_defaults_warnings_when_empty(monkeypatch):
         def poll():
             return None
 
-    monkeypatch.setattr(os.path, "isfile", lambda path: True)
-    monkeypatch.setattr(os, "access", lambda path, mode: True)
-    monkeypatch.setattr("server_runtime.supervisor.ASA_CTRL_BIN", "/usr/local/bin/asa-ctrl")
+    asa_ctrl = tmp_path / "asa-ctrl"
+    asa_ctrl.write_text("#!/bin/sh\n", encoding="utf-8")
+    asa_ctrl.chmod(0o755)
+    monkeypatch.setattr("server_runtime.supervisor.ASA_CTRL_BIN", str(asa_ctrl))
     monkeypatch.setattr("server_runtime.supervisor.subprocess.Popen", lambda *args, **kwargs: DummyProcess())
 
     supervisor.start_restart_scheduler()
@@ -434,19 +875,60 @@ def test_scheduler_contract_defaults_warnings_when_empty(monkeypatch):
 def test_chown_path_uses_no_symlink_follow(monkeypatch, tmp_path):
     calls = []
 
-    def fake_chown(path, user=None, group=None, follow_symlinks=True):
+    def fake_chown(path, uid, gid, follow_symlinks=True):
         calls.append({
             "path": path,
-            "user": user,
-            "group": group,
+            "uid": uid,
+            "gid": gid,
             "follow_symlinks": follow_symlinks,
         })
 
-    monkeypatch.setattr(runtime_permissions.shutil, "chown", fake_chown)
+    monkeypatch.setattr(runtime_permissions.os, "chown", fake_chown)
 
     runtime_permissions._chown_path(tmp_path)
 
     assert calls[0]["follow_symlinks"] is False
+    assert (calls[0]["uid"], calls[0]["gid"]) == (runtime_permissions.TARGET_UID, runtime_permissions.TARGET_GID)
+
+def test_chown_if_possible_walks_tree_without_following_symlinks(monkeypatch, tmp_path):
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "sub" / "file.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "top.txt").write_text("x", encoding="utf-8")
+    outside = tmp_path.parent / f"{tmp_path.name}-outside"
+    outside.mkdir()
+    (outside / "secret.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "link").symlink_to(outside, target_is_directory=True)
+
+    calls = []
+    monkeypatch.setattr(runtime_permissions, "_chown_path", lambda path: calls.append(os.fspath(path)))
+
+    runtime_permissions._chown_if_possible(tmp_path, recursive=True)
+
+    expected = {
+        str(tmp_path),
+        str(tmp_path / "sub"),
+        str(tmp_path / "sub" / "deeper"),
+        str(tmp_path / "sub" / "file.txt"),
+        str(tmp_path / "top.txt"),
+        str(tmp_path / "link"),
+    }
+    assert sorted(calls) == sorted(expected)
+
+
+def test_chown_if_possible_skips_entries_already_owned(monkeypatch, tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "file.txt").write_text("x", encoding="utf-8")
+
+    calls = []
+    monkeypatch.setattr(runtime_permissions, "_chown_path", lambda path: calls.append(os.fspath(path)))
+    monkeypatch.setattr(runtime_permissions, "TARGET_UID", os.getuid())
+    monkeypatch.setattr(runtime_permissions, "TARGET_GID", os.getgid())
+
+    runtime_permissions._chown_if_possible(tmp_path, recursive=True)
+    runtime_permissions._chown_if_possible(tmp_path, recursive=False)
+
+    assert calls == []
+
 
 def test_prepare_runtime_env_preserves_headless_env_overrides(monkeypatch, tmp_path):
     logger = logging.getLogger("test-runtime-env-overrides")
@@ -468,6 +950,72 @@ def test_prepare_runtime_env_preserves_headless_env_overrides(monkeypatch, tmp_p
     assert os.environ["XDG_SESSION_TYPE"] == "tty"
 
 
+def test_resolve_launch_binary_extracts_plugin_loader(monkeypatch, tmp_path):
+    with zipfile.ZipFile(tmp_path / "AsaApi_1.0.zip", "w") as archive:
+        archive.writestr("AsaApiLoader.exe", b"loader")
+        archive.writestr("ArkApi/Plugins/readme.txt", b"plugins")
+    monkeypatch.setattr(runtime_plugins, "ASA_BINARY_DIR", str(tmp_path))
+
+    binary = runtime_plugins.resolve_launch_binary(logging.getLogger("test-plugins"))
+
+    assert binary == runtime_plugins.ASA_PLUGIN_BINARY_NAME
+    assert (tmp_path / "AsaApiLoader.exe").read_bytes() == b"loader"
+    assert (tmp_path / "ArkApi" / "Plugins" / "readme.txt").read_bytes() == b"plugins"
+    assert not (tmp_path / "AsaApi_1.0.zip").exists()
+
+
+def test_resolve_launch_binary_rejects_zip_traversal(monkeypatch, tmp_path):
+    binary_dir = tmp_path / "bin"
+    binary_dir.mkdir()
+    with zipfile.ZipFile(binary_dir / "AsaApi_1.0.zip", "w") as archive:
+        archive.writestr("../escape.txt", b"nope")
+    monkeypatch.setattr(runtime_plugins, "ASA_BINARY_DIR", str(binary_dir))
+
+    with pytest.raises(RuntimeError, match="Unsafe zip member path"):
+        runtime_plugins.resolve_launch_binary(logging.getLogger("test-plugins"))
+    assert not (tmp_path / "escape.txt").exists()
+
+
+def test_resolve_launch_binary_rejects_escape_through_existing_symlink(monkeypatch, tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    binary_dir = tmp_path / "bin"
+    binary_dir.mkdir()
+    (binary_dir / "ArkApi").symlink_to(outside)
+    with zipfile.ZipFile(binary_dir / "AsaApi_1.0.zip", "w") as archive:
+        archive.writestr("ArkApi/evil.dll", b"nope")
+    monkeypatch.setattr(runtime_plugins, "ASA_BINARY_DIR", str(binary_dir))
+
+    with pytest.raises(RuntimeError, match="Unsafe zip member path"):
+        runtime_plugins.resolve_launch_binary(logging.getLogger("test-plugins"))
+    assert not (outside / "evil.dll").exists()
+
+
+def test_configure_timezone_skips_rewrite_when_unchanged(monkeypatch, tmp_path):
+    zoneinfo = runtime_bootstrap.Path("/usr/share/zoneinfo") / "UTC"
+    if not zoneinfo.exists():
+        pytest.skip("timezone data unavailable")
+    localtime = tmp_path / "localtime"
+    timezone_file = tmp_path / "timezone"
+    localtime.symlink_to(zoneinfo)
+    timezone_file.write_text("UTC\n", encoding="utf-8")
+
+    monkeypatch.setattr(runtime_bootstrap, "ETC_LOCALTIME_PATH", str(localtime))
+    monkeypatch.setattr(runtime_bootstrap, "ETC_TIMEZONE_PATH", str(timezone_file))
+    monkeypatch.setattr(runtime_bootstrap.os, "geteuid", lambda: 0)
+    monkeypatch.setenv("TZ", "UTC")
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("unchanged timezone files should not be rewritten")
+
+    monkeypatch.setattr(runtime_bootstrap.Path, "unlink", fail)
+    monkeypatch.setattr(runtime_bootstrap.Path, "write_text", fail)
+
+    runtime_bootstrap.configure_timezone(logging.getLogger("test-timezone"))
+
+    assert os.environ["TZ"] == "UTC"
+
+
 def test_ensure_machine_id_creates_files(monkeypatch, tmp_path):
     etc_machine_id = tmp_path / "etc" / "machine-id"
     dbus_machine_id = tmp_path / "var" / "lib" / "dbus" / "machine-id"